@@ -1,11 +1,13 @@
 """FastAPI server for video analytics API"""
 
 import uvicorn
+import hashlib
 import json
 import asyncio
 import bcrypt
 from fastapi import FastAPI, HTTPException, Query, Path, Request, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -13,7 +15,7 @@ from pydantic import BaseModel, EmailStr
 from sse_starlette.sse import EventSourceResponse
 from jose import JWTError, jwt
 
-from analytics.database import AnalyticsDatabase, VideoRecord, VideoMetrics, User
+from analytics.database import AnalyticsDatabase, VideoRecord, VideoMetrics, User, dump_metadata
 from analytics.oauth_channel_discovery import OAuthChannelDiscovery, ChannelStats
 from content_creation.watcher_events import get_event_emitter
 from content_creation.obs_detector import OBSDetector
@@ -144,6 +146,14 @@ app.add_middleware(
 db = AnalyticsDatabase()
 channel_discovery = OAuthChannelDiscovery(db)
 
+def etag_response(request: Request, model: BaseModel) -> Response:
+    """Serialize a response model with an ETag, answering 304 when the client's copy is current"""
+    body = model.model_dump_json().encode('utf-8')
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
 # Auth helper functions
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
@@ -489,13 +499,13 @@ async def get_top_videos_with_metrics(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/videos/{video_id}", response_model=VideoResponse)
-async def get_video(video_id: str = Path(..., description="Video ID")):
+async def get_video(request: Request, video_id: str = Path(..., description="Video ID")):
     """Get a video record by ID"""
     video = db.get_video(video_id)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
     
-    return VideoResponse(
+    return etag_response(request, VideoResponse(
         id=video.id,
         video_id=video.video_id,
         title=video.title,
@@ -509,7 +519,7 @@ async def get_video(video_id: str = Path(..., description="Video ID")):
         created_at=video.created_at,
         uploaded_at=video.uploaded_at,
         status=video.status
-    )
+    ))
 
 @app.get("/videos", response_model=List[VideoResponse])
 async def list_videos(
@@ -658,12 +668,13 @@ async def get_metrics_history(
 # Analytics endpoints
 @app.get("/analytics/summary", response_model=AnalyticsSummaryResponse)
 async def get_analytics_summary(
+    request: Request,
     platform: Optional[str] = Query(None, description="Filter by platform"),
     days: int = Query(30, description="Number of days to analyze")
 ):
     """Get analytics summary"""
     summary = db.get_analytics_summary(platform, days)
-    return AnalyticsSummaryResponse(**summary)
+    return etag_response(request, AnalyticsSummaryResponse(**summary))
 
 @app.get("/analytics/trends")
 async def get_analytics_trends(
@@ -815,7 +826,6 @@ async def get_channel_trends(days: int = Query(30, description="Number of days t
     """Get channel trends data for the specified number of days."""
     try:
         # Get real historical data from daily snapshots
-        db = AnalyticsDatabase()
         snapshots = db.get_daily_snapshots(days=days)
         
         if not snapshots:
@@ -970,7 +980,6 @@ class SchedulePostRequest(BaseModel):
 async def get_upcoming_schedule(hours: int = Query(24, ge=1, le=168)):
     """Get scheduled posts for the next N hours."""
     try:
-        db = AnalyticsDatabase()
         posts = db.get_upcoming_schedule(hours=hours)
         
         return {
@@ -999,7 +1008,6 @@ async def get_upcoming_schedule(hours: int = Query(24, ge=1, le=168)):
 async def get_scheduled_post(post_id: int):
     """Get a specific scheduled post by ID."""
     try:
-        db = AnalyticsDatabase()
         post = db.get_scheduled_post(post_id)
         
         if not post:
@@ -1076,7 +1084,6 @@ async def force_post_now(post_id: int):
 async def cancel_scheduled_post(post_id: int):
     """Cancel/delete a scheduled post."""
     try:
-        db = AnalyticsDatabase()
         success = db.cancel_scheduled_post(post_id)
         
         if not success:
@@ -1096,7 +1103,6 @@ async def cancel_scheduled_post(post_id: int):
 async def reschedule_post(post_id: int, new_time: datetime):
     """Change the scheduled time for a post."""
     try:
-        db = AnalyticsDatabase()
         success = db.reschedule_post(post_id, new_time)
         
         if not success:
@@ -1123,7 +1129,6 @@ async def update_post_metadata(
 ):
     """Update metadata for a scheduled post."""
     try:
-        db = AnalyticsDatabase()
         
         # Get current post
         post = db.get_scheduled_post(post_id)
@@ -1144,7 +1149,7 @@ async def update_post_metadata(
         # Update metadata
         success = db.update_scheduled_post_metadata(
             post_id, 
-            json.dumps(metadata),
+            dump_metadata(metadata),
             ",".join(platforms) if platforms else None
         )
         
@@ -1165,7 +1170,6 @@ async def update_post_metadata(
 async def get_completed_posts(days: int = Query(7, ge=1, le=30)):
     """Get completed posts from the last N days."""
     try:
-        db = AnalyticsDatabase()
         # Get completed posts from the database
         completed_posts = db.get_completed_posts(days=days)
         
@@ -1228,7 +1232,6 @@ class TestPromptRequest(BaseModel):
 async def get_prompt_templates():
     """List all prompt templates."""
     try:
-        db = AnalyticsDatabase()
         templates = db.list_prompt_templates()
         
         return {
@@ -1253,7 +1256,6 @@ async def get_prompt_templates():
 async def get_active_template():
     """Get the currently active template."""
     try:
-        db = AnalyticsDatabase()
         template = db.get_active_prompt_template()
         
         if not template:
@@ -1279,7 +1281,6 @@ async def create_template(request: TemplateCreateRequest):
     try:
         from analytics.database import AIPromptTemplate
         
-        db = AnalyticsDatabase()
         template = AIPromptTemplate(
             name=request.name,
             prompt_text=request.prompt_text,
@@ -1307,7 +1308,6 @@ async def create_template(request: TemplateCreateRequest):
 async def update_template(template_id: int, request: TemplateUpdateRequest):
     """Update an existing template."""
     try:
-        db = AnalyticsDatabase()
         success = db.update_prompt_template(
             template_id=template_id,
             name=request.name,
@@ -1331,7 +1331,6 @@ async def update_template(template_id: int, request: TemplateUpdateRequest):
 async def delete_template(template_id: int):
     """Delete a template."""
     try:
-        db = AnalyticsDatabase()
         success = db.delete_prompt_template(template_id)
         
         if not success:
@@ -1351,7 +1350,6 @@ async def delete_template(template_id: int):
 async def activate_template(template_id: int):
     """Set a template as active (deactivates all others)."""
     try:
-        db = AnalyticsDatabase()
         success = db.activate_prompt_template(template_id)
         
         if not success:
@@ -1786,7 +1784,6 @@ def get_missed_replays():
                     if f.is_file() and f.suffix.lower() in video_exts]
     
     # Get processed filenames and scheduled video paths
-    db = AnalyticsDatabase()
     scheduled_posts = db.get_all_scheduled_posts()
     scheduled_paths = set()
     for post in scheduled_posts:
@@ -1876,7 +1873,6 @@ async def schedule_replay(
         )
         
         # Determine scheduled time
-        db = AnalyticsDatabase()
         if scheduled_time:
             # Parse provided time
             try:
@@ -1893,7 +1889,7 @@ async def schedule_replay(
         from analytics.database import ScheduledPost
         post = ScheduledPost(
             video_path=str(processed_path),
-            metadata_json=json.dumps(metadata),
+            metadata_json=dump_metadata(metadata),
             platforms=",".join(platforms),
             scheduled_time=scheduled_dt,
             status="pending",
@@ -1954,10 +1950,11 @@ async def schedule_replays_batch(
             raise HTTPException(status_code=400, detail="No platforms configured")
         
         # Get scheduled times for all videos (spaced 1 hour apart)
-        db = AnalyticsDatabase()
         scheduled_times = space_videos(platforms, len(video_paths))
         
         results = []
+        # Processed posts are inserted together at the end, in a single transaction
+        pending = []
         
         for i, video_path in enumerate(video_paths):
             try:
@@ -1979,22 +1976,22 @@ async def schedule_replays_batch(
                 from analytics.database import ScheduledPost
                 post = ScheduledPost(
                     video_path=str(processed_path),
-                    metadata_json=json.dumps(metadata),
+                    metadata_json=dump_metadata(metadata),
                     platforms=",".join(platforms),
                     scheduled_time=scheduled_times[i],
                     status="pending",
                     created_at=datetime.now()
                 )
                 
-                post_id = db.add_scheduled_post(post)
-                
-                results.append({
+                result = {
                     "video_path": video_path,
                     "success": True,
-                    "post_id": post_id,
+                    "post_id": None,
                     "scheduled_time": scheduled_times[i].isoformat(),
                     "metadata": metadata
-                })
+                }
+                results.append(result)
+                pending.append((post, result))
             except Exception as e:
                 results.append({
                     "video_path": video_path,
@@ -2002,6 +1999,17 @@ async def schedule_replays_batch(
                     "error": str(e)
                 })
         
+        if pending:
+            try:
+                post_ids = db.add_scheduled_posts([post for post, _ in pending])
+                for (_, result), post_id in zip(pending, post_ids, strict=True):
+                    result["post_id"] = post_id
+            except Exception as e:
+                # Keep the per-video results instead of failing the whole batch
+                for _, result in pending:
+                    result["success"] = False
+                    result["error"] = str(e)
+        
         successful = sum(1 for r in results if r["success"])
         
         return {
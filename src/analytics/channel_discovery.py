@@ -12,7 +12,7 @@ from analytics.metrics_collector import YouTubeMetricsCollector, InstagramMetric
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class ChannelVideo:
     """Video discovered from a channel"""
     platform: str
@@ -24,7 +24,7 @@ class ChannelVideo:
     platform_url: str
     thumbnail_url: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ChannelStats:
     """Aggregated channel statistics"""
     platform: str
@@ -282,10 +282,11 @@ class ChannelDiscovery:
     
     async def _sync_videos_to_db(self, videos: List[ChannelVideo]):
         """Sync discovered videos to the database"""
+        # Check which videos already exist with a single query
+        existing_ids = self.db.get_existing_video_ids([video.platform_video_id for video in videos])
+        
         for video in videos:
-            # Check if video already exists
-            existing = self.db.get_video(video.platform_video_id)
-            if existing:
+            if video.platform_video_id in existing_ids:
                 continue
             
             # Create video record
@@ -322,40 +323,48 @@ class ChannelDiscovery:
                 platform_videos[video.platform] = []
             platform_videos[video.platform].append(video)
         
+        # Load latest metrics for every video in one query
+        latest = self.db.get_latest_metrics_bulk([(video.video_id, video.platform) for video in all_videos])
+        
         # Calculate stats for each platform
         for platform, videos in platform_videos.items():
             total_views = 0
             total_likes = 0
             total_shares = 0
             total_comments = 0
-            engagement_rates = []
-            most_popular_video = None
+            sum_engagement = 0.0
+            measured_count = 0
+            most_popular = None
             max_views = 0
             
             for video in videos:
-                # Get latest metrics
-                metrics = self.db.get_latest_metrics(video.video_id, platform)
+                metrics = latest.get((video.video_id, platform))
                 if metrics:
                     total_views += metrics.views
                     total_likes += metrics.likes
                     total_shares += metrics.shares
                     total_comments += metrics.comments
-                    engagement_rates.append(metrics.engagement_rate)
+                    sum_engagement += metrics.engagement_rate
+                    measured_count += 1
                     
-                    # Track most popular video
+                    # Track most popular video; only the winner is built below
                     if metrics.views > max_views:
                         max_views = metrics.views
-                        most_popular_video = ChannelVideo(
-                            platform=platform,
-                            platform_video_id=video.platform_video_id,
-                            title=video.title,
-                            description=video.description,
-                            published_at=video.created_at,
-                            duration=video.duration,
-                            platform_url=video.platform_url
-                        )
+                        most_popular = video
+            
+            most_popular_video = None
+            if most_popular:
+                most_popular_video = ChannelVideo(
+                    platform=platform,
+                    platform_video_id=most_popular.platform_video_id,
+                    title=most_popular.title,
+                    description=most_popular.description,
+                    published_at=most_popular.created_at,
+                    duration=most_popular.duration,
+                    platform_url=most_popular.platform_url
+                )
             
-            avg_engagement = sum(engagement_rates) / len(engagement_rates) if engagement_rates else 0.0
+            avg_engagement = sum_engagement / measured_count if measured_count else 0.0
             
             stats[platform] = ChannelStats(
                 platform=platform,
@@ -376,8 +385,9 @@ class ChannelDiscovery:
         total_views = 0
         platform_views = {}
         
+        latest = self.db.get_latest_metrics_bulk([(video.video_id, video.platform) for video in all_videos])
         for video in all_videos:
-            metrics = self.db.get_latest_metrics(video.video_id, video.platform)
+            metrics = latest.get((video.video_id, video.platform))
             if metrics:
                 views = metrics.views
                 total_views += views
@@ -2,11 +2,16 @@
 
 import sqlite3
 import json
+import time
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
+def dump_metadata(metadata: Dict[str, Any]) -> str:
+    """Serialize scheduled-post metadata compactly"""
+    return json.dumps(metadata, separators=(",", ":"), ensure_ascii=False)
+
 @dataclass
 class VideoRecord:
     """Video record in the analytics database"""
@@ -94,11 +99,22 @@ class AnalyticsDatabase:
         self.db_path = Path(db_path)
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with per-connection performance pragmas applied"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
+    
     def init_database(self):
         """Initialize the database with required tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
+            # WAL lets readers run alongside writers; the mode persists in the file
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             # Videos table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS videos (
@@ -193,11 +209,33 @@ class AnalyticsDatabase:
                 )
             """)
             
+            # HTTP ETag cache for conditional API requests
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS etag_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    etag TEXT NOT NULL,
+                    body BLOB,
+                    stored_at REAL
+                )
+            """)
+            
+            # Whether a video counts toward channel stats (YouTube counts Shorts only).
+            # SQLite can only add VIRTUAL generated columns to an existing table.
+            cursor.execute("PRAGMA table_xinfo(videos)")
+            if "is_countable_short" not in {row[1] for row in cursor.fetchall()}:
+                cursor.execute("""
+                    ALTER TABLE videos ADD COLUMN is_countable_short BOOLEAN
+                    GENERATED ALWAYS AS (platform <> 'youtube' OR duration <= 60) VIRTUAL
+                """)
+            
             # Create indexes for better performance
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_videos_platform ON videos(platform)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_videos_status ON videos(status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_videos_countable ON videos(status, is_countable_short)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_metrics_video_id ON video_metrics(video_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_metrics_platform ON video_metrics(platform)")
+            # Covers the latest-row-per-video lookups (ORDER BY collected_at DESC per video/platform)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_metrics_latest ON video_metrics(video_id, platform, collected_at DESC)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_scheduled_status ON scheduled_posts(status)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_scheduled_time ON scheduled_posts(scheduled_time)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_template_active ON ai_prompt_templates(is_active)")
@@ -208,7 +246,7 @@ class AnalyticsDatabase:
     
     def add_video(self, video: VideoRecord) -> int:
         """Add a new video record to the database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -226,6 +264,29 @@ class AnalyticsDatabase:
             conn.commit()
             return cursor.lastrowid
     
+    def add_videos_bulk(self, videos: List[VideoRecord]) -> int:
+        """Add many video records in a single transaction, skipping existing video_ids"""
+        if not videos:
+            return 0
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            
+            cursor.executemany("""
+                INSERT OR IGNORE INTO videos (
+                    video_id, title, description, prompt, platform,
+                    platform_video_id, platform_url, duration, file_path,
+                    created_at, uploaded_at, status
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(
+                video.video_id, video.title, video.description, video.prompt,
+                video.platform, video.platform_video_id, video.platform_url,
+                video.duration, video.file_path, video.created_at, video.uploaded_at, video.status
+            ) for video in videos])
+            
+            conn.commit()
+            return cursor.rowcount
+    
     def update_video(self, video_id: str, updates: Dict[str, Any]) -> bool:
         """Update a video record"""
         if not updates:
@@ -245,7 +306,7 @@ class AnalyticsDatabase:
         
         values.append(video_id)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(f"""
                 UPDATE videos 
@@ -258,7 +319,7 @@ class AnalyticsDatabase:
     
     def get_video(self, video_id: str) -> Optional[VideoRecord]:
         """Get a video record by video_id"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM videos WHERE video_id = ?", (video_id,))
             row = cursor.fetchone()
@@ -272,12 +333,33 @@ class AnalyticsDatabase:
                 )
             return None
     
+    def get_existing_video_ids(self, video_ids: List[str]) -> set:
+        """Return the subset of video_ids that already exist in the videos table"""
+        existing = set()
+        if not video_ids:
+            return existing
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            
+            # Chunk to stay well under SQLite's bound-parameter limit
+            for i in range(0, len(video_ids), 500):
+                chunk = video_ids[i:i+500]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor.execute(f"SELECT video_id FROM videos WHERE video_id IN ({placeholders})", chunk)
+                existing.update(row[0] for row in cursor.fetchall())
+        
+        return existing
+    
     def list_videos(self, platform: Optional[str] = None, status: Optional[str] = None, 
-                   limit: int = 100, offset: int = 0) -> List[VideoRecord]:
+                   limit: int = 100, offset: int = 0, countable_only: bool = False) -> List[VideoRecord]:
         """List videos with optional filtering"""
         query = "SELECT * FROM videos WHERE 1=1"
         params = []
         
+        if countable_only:
+            query += " AND is_countable_short = 1"
+        
         if platform:
             query += " AND platform = ?"
             params.append(platform)
@@ -289,7 +371,7 @@ class AnalyticsDatabase:
         query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             rows = cursor.fetchall()
@@ -305,6 +387,42 @@ class AnalyticsDatabase:
             
             return videos
     
+    def iter_video_batches(self, platform: Optional[str] = None, status: Optional[str] = None,
+                           countable_only: bool = False, batch_size: int = 1000) -> Iterator[List[VideoRecord]]:
+        """Stream videos matching the filters in batches instead of loading them all at once"""
+        query = "SELECT * FROM videos WHERE 1=1"
+        params = []
+        
+        if countable_only:
+            query += " AND is_countable_short = 1"
+        
+        if platform:
+            query += " AND platform = ?"
+            params.append(platform)
+        
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                
+                yield [
+                    VideoRecord(
+                        id=row[0], video_id=row[1], title=row[2], description=row[3],
+                        prompt=row[4], platform=row[5], platform_video_id=row[6],
+                        platform_url=row[7], duration=row[8], file_path=row[9],
+                        created_at=row[10], uploaded_at=row[11], status=row[12]
+                    )
+                    for row in rows
+                ]
+    
     def get_top_videos_with_metrics(self, limit: int = 10, platform: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get top videos with their latest metrics in a single query"""
         query = """
@@ -335,7 +453,7 @@ class AnalyticsDatabase:
         query += " ORDER BY COALESCE(m.views, 0) DESC LIMIT ?"
         params.append(limit)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             rows = cursor.fetchall()
@@ -360,7 +478,7 @@ class AnalyticsDatabase:
     
     def add_metrics(self, metrics: VideoMetrics) -> int:
         """Add video metrics to the database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -376,6 +494,27 @@ class AnalyticsDatabase:
             conn.commit()
             return cursor.lastrowid
     
+    def add_metrics_bulk(self, metrics_list: List[VideoMetrics]) -> int:
+        """Add many video metrics rows in a single transaction"""
+        if not metrics_list:
+            return 0
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            
+            cursor.executemany("""
+                INSERT INTO video_metrics (
+                    video_id, platform, views, likes, shares, comments,
+                    engagement_rate, collected_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(
+                metrics.video_id, metrics.platform, metrics.views, metrics.likes,
+                metrics.shares, metrics.comments, metrics.engagement_rate, metrics.collected_at
+            ) for metrics in metrics_list])
+            
+            conn.commit()
+            return cursor.rowcount
+    
     def get_latest_metrics(self, video_id: str, platform: Optional[str] = None) -> Optional[VideoMetrics]:
         """Get the latest metrics for a video"""
         query = "SELECT * FROM video_metrics WHERE video_id = ?"
@@ -387,7 +526,7 @@ class AnalyticsDatabase:
         
         query += " ORDER BY collected_at DESC LIMIT 1"
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             row = cursor.fetchone()
@@ -400,6 +539,129 @@ class AnalyticsDatabase:
                 )
             return None
     
+    def get_latest_metrics_bulk(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], VideoMetrics]:
+        """Get the latest metrics for many (video_id, platform) pairs in a single pass"""
+        results = {}
+        if not keys:
+            return results
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            
+            # Chunk to stay well under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 400):
+                chunk = keys[i:i+400]
+                placeholders = ', '.join(['(?, ?)'] * len(chunk))
+                params = [value for key in chunk for value in key]
+                
+                cursor.execute(f"""
+                    SELECT id, video_id, platform, views, likes, shares, comments,
+                           engagement_rate, collected_at
+                    FROM (
+                        SELECT *, ROW_NUMBER() OVER (
+                            PARTITION BY video_id, platform
+                            ORDER BY collected_at DESC, id DESC
+                        ) AS rn
+                        FROM video_metrics
+                        WHERE (video_id, platform) IN (VALUES {placeholders})
+                    )
+                    WHERE rn = 1
+                """, params)
+                
+                for row in cursor.fetchall():
+                    results[(row[1], row[2])] = VideoMetrics(
+                        id=row[0], video_id=row[1], platform=row[2], views=row[3],
+                        likes=row[4], shares=row[5], comments=row[6], engagement_rate=row[7],
+                        collected_at=row[8]
+                    )
+        
+        return results
+    
+    def get_channel_aggregates(self, status: str = "published") -> Dict[str, Dict[str, Any]]:
+        """Get per-platform totals over each video's latest metrics, computed in SQL"""
+        # Only countable videos (YouTube Shorts) feed the totals, but every platform
+        # with a video in this status is reported, with zeros if none are countable
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                WITH latest AS (
+                    SELECT video_id, platform, views, likes, shares, comments, engagement_rate,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY video_id, platform
+                               ORDER BY collected_at DESC, id DESC
+                           ) AS rn
+                    FROM video_metrics
+                )
+                SELECT
+                    v.platform,
+                    SUM(v.is_countable_short),
+                    COALESCE(SUM(m.views), 0),
+                    COALESCE(SUM(m.likes), 0),
+                    COALESCE(SUM(m.shares), 0),
+                    COALESCE(SUM(m.comments), 0),
+                    COALESCE(AVG(m.engagement_rate), 0.0)
+                FROM videos v
+                LEFT JOIN latest m
+                    ON m.video_id = v.video_id AND m.platform = v.platform AND m.rn = 1
+                    AND v.is_countable_short = 1
+                WHERE v.status = ?
+                GROUP BY v.platform
+            """, (status,))
+            
+            return {
+                row[0]: {
+                    'total_videos': row[1],
+                    'total_views': row[2],
+                    'total_likes': row[3],
+                    'total_shares': row[4],
+                    'total_comments': row[5],
+                    'avg_engagement_rate': row[6]
+                }
+                for row in cursor.fetchall()
+            }
+    
+    def get_most_popular_video(self, platform: str, 
+                               status: str = "published") -> Optional[Tuple[VideoRecord, VideoMetrics]]:
+        """Get the video with the most views on a platform along with its latest metrics"""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                WITH latest AS (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY video_id
+                        ORDER BY collected_at DESC, id DESC
+                    ) AS rn
+                    FROM video_metrics
+                    WHERE platform = ?
+                )
+                SELECT v.id, v.video_id, v.title, v.description, v.prompt, v.platform,
+                       v.platform_video_id, v.platform_url, v.duration, v.file_path,
+                       v.created_at, v.uploaded_at, v.status,
+                       m.id, m.views, m.likes, m.shares, m.comments, m.engagement_rate, m.collected_at
+                FROM videos v
+                JOIN latest m ON m.video_id = v.video_id AND m.rn = 1
+                WHERE v.platform = ? AND v.status = ? AND v.is_countable_short = 1
+                ORDER BY m.views DESC
+                LIMIT 1
+            """, (platform, platform, status))
+            row = cursor.fetchone()
+            
+            if not row:
+                return None
+            
+            video = VideoRecord(
+                id=row[0], video_id=row[1], title=row[2], description=row[3],
+                prompt=row[4], platform=row[5], platform_video_id=row[6],
+                platform_url=row[7], duration=row[8], file_path=row[9],
+                created_at=row[10], uploaded_at=row[11], status=row[12]
+            )
+            metrics = VideoMetrics(
+                id=row[13], video_id=row[1], platform=row[5], views=row[14],
+                likes=row[15], shares=row[16], comments=row[17], engagement_rate=row[18],
+                collected_at=row[19]
+            )
+            return video, metrics
+    
     def get_metrics_history(self, video_id: str, platform: Optional[str] = None, 
                            limit: int = 30) -> List[VideoMetrics]:
         """Get metrics history for a video"""
@@ -413,7 +675,7 @@ class AnalyticsDatabase:
         query += " ORDER BY collected_at DESC LIMIT ?"
         params.append(limit)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             rows = cursor.fetchall()
@@ -431,7 +693,7 @@ class AnalyticsDatabase:
     def get_analytics_summary(self, platform: Optional[str] = None, 
                             days: int = 30) -> Dict[str, Any]:
         """Get analytics summary for the specified period"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Base query for date filtering
@@ -485,7 +747,7 @@ class AnalyticsDatabase:
     def reset_platform_data(self, platform: str) -> bool:
         """Reset all data for a specific platform."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Delete videos for the platform
@@ -505,11 +767,48 @@ class AnalyticsDatabase:
             print(f"[ERROR] Failed to reset {platform.upper()} data: {e}")
             return False
     
+    # ETag Cache Methods
+    
+    def get_etag(self, cache_key: str) -> Optional[Tuple[str, Any]]:
+        """Get the cached ETag and decoded response body for a request key"""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT etag, body FROM etag_cache WHERE cache_key = ?", (cache_key,))
+            row = cursor.fetchone()
+            
+            if row:
+                return row[0], json.loads(row[1])
+            return None
+    
+    def set_etag(self, cache_key: str, etag: str, body: Any) -> None:
+        """Store the ETag and response body for a request key"""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO etag_cache (cache_key, etag, body, stored_at)
+                VALUES (?, ?, ?, ?)
+            """, (cache_key, etag, json.dumps(body).encode('utf-8'), time.time()))
+            conn.commit()
+    
+    def touch_etag(self, cache_key: str) -> None:
+        """Mark a cached ETag entry as freshly revalidated"""
+        with self._connect() as conn:
+            conn.execute("UPDATE etag_cache SET stored_at = ? WHERE cache_key = ?", (time.time(), cache_key))
+            conn.commit()
+    
+    def prune_etags(self, max_age_seconds: float) -> int:
+        """Delete ETag cache entries older than max_age_seconds"""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM etag_cache WHERE stored_at < ?", (time.time() - max_age_seconds,))
+            conn.commit()
+            return cursor.rowcount
+    
     # Scheduled Posts Methods
     
     def add_scheduled_post(self, post: ScheduledPost) -> int:
         """Add a new scheduled post to the database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -525,9 +824,30 @@ class AnalyticsDatabase:
             conn.commit()
             return cursor.lastrowid
     
+    def add_scheduled_posts(self, posts: List[ScheduledPost]) -> List[int]:
+        """Add several scheduled posts in one transaction, returning their ids in order"""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            post_ids = []
+            
+            for post in posts:
+                cursor.execute("""
+                    INSERT INTO scheduled_posts (
+                        video_path, metadata_json, platforms, scheduled_time,
+                        status, created_at, processed_at, error_message, retry_count
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    post.video_path, post.metadata_json, post.platforms, post.scheduled_time,
+                    post.status, post.created_at, post.processed_at, post.error_message, post.retry_count
+                ))
+                post_ids.append(cursor.lastrowid)
+            
+            conn.commit()
+            return post_ids
+    
     def get_pending_posts(self, grace_period_minutes: int = 60) -> List[ScheduledPost]:
         """Get posts that are ready to upload (scheduled_time <= now and status = pending)"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Get posts that are due (including those missed during downtime)
@@ -558,7 +878,7 @@ class AnalyticsDatabase:
     def update_post_status(self, post_id: int, status: str, error_message: str = "", 
                           processed_at: Optional[datetime] = None, increment_retry: bool = False) -> bool:
         """Update the status of a scheduled post"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             if increment_retry:
@@ -594,7 +914,7 @@ class AnalyticsDatabase:
         query += " ORDER BY scheduled_time DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             rows = cursor.fetchall()
@@ -616,7 +936,7 @@ class AnalyticsDatabase:
     
     def cancel_scheduled_post(self, post_id: int) -> bool:
         """Mark a scheduled post as cancelled"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Only allow cancelling pending posts
@@ -633,7 +953,7 @@ class AnalyticsDatabase:
         """Force a scheduled post to post immediately by setting scheduled_time to now"""
         from datetime import datetime
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Update scheduled time to now for pending posts
@@ -649,7 +969,7 @@ class AnalyticsDatabase:
     
     def get_scheduled_post(self, post_id: int) -> Optional[ScheduledPost]:
         """Get a specific scheduled post by ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM scheduled_posts WHERE id = ?", (post_id,))
             row = cursor.fetchone()
@@ -685,7 +1005,7 @@ class AnalyticsDatabase:
         now = datetime.now()
         end_time = now + timedelta(hours=hours)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT * FROM scheduled_posts 
@@ -716,7 +1036,7 @@ class AnalyticsDatabase:
         now = datetime.now()
         start_time = now - timedelta(days=days)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT * FROM scheduled_posts 
@@ -743,7 +1063,7 @@ class AnalyticsDatabase:
     
     def has_post_at_time(self, platform: str, scheduled_time: datetime) -> bool:
         """Check if there's already a post scheduled for this platform at this time"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT COUNT(*) FROM scheduled_posts 
@@ -756,7 +1076,7 @@ class AnalyticsDatabase:
     
     def reschedule_post(self, post_id: int, new_time: datetime) -> bool:
         """Update the scheduled time for a post"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 UPDATE scheduled_posts 
@@ -768,7 +1088,7 @@ class AnalyticsDatabase:
     
     def update_scheduled_post_metadata(self, post_id: int, metadata_json: str, platforms: Optional[str] = None) -> bool:
         """Update metadata for a scheduled post"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             if platforms is not None:
                 cursor.execute("""
@@ -789,7 +1109,7 @@ class AnalyticsDatabase:
     
     def add_prompt_template(self, template: AIPromptTemplate) -> int:
         """Add a new AI prompt template"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO ai_prompt_templates (name, prompt_text, is_active, created_at, updated_at)
@@ -801,7 +1121,7 @@ class AnalyticsDatabase:
     
     def get_prompt_template(self, template_id: int) -> Optional[AIPromptTemplate]:
         """Get a specific prompt template by ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM ai_prompt_templates WHERE id = ?", (template_id,))
             row = cursor.fetchone()
@@ -819,7 +1139,7 @@ class AnalyticsDatabase:
     
     def get_active_prompt_template(self) -> Optional[AIPromptTemplate]:
         """Get the currently active prompt template"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM ai_prompt_templates WHERE is_active = 1 LIMIT 1")
             row = cursor.fetchone()
@@ -837,7 +1157,7 @@ class AnalyticsDatabase:
     
     def list_prompt_templates(self) -> List[AIPromptTemplate]:
         """List all prompt templates"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM ai_prompt_templates ORDER BY created_at DESC")
             rows = cursor.fetchall()
@@ -876,7 +1196,7 @@ class AnalyticsDatabase:
         params.append(datetime.now())
         params.append(template_id)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(f"""
                 UPDATE ai_prompt_templates 
@@ -888,7 +1208,7 @@ class AnalyticsDatabase:
     
     def activate_prompt_template(self, template_id: int) -> bool:
         """Set a template as active (deactivates all others)"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Deactivate all templates
@@ -902,7 +1222,7 @@ class AnalyticsDatabase:
     
     def delete_prompt_template(self, template_id: int) -> bool:
         """Delete a prompt template"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM ai_prompt_templates WHERE id = ?", (template_id,))
             conn.commit()
@@ -911,7 +1231,7 @@ class AnalyticsDatabase:
     # User management methods
     def create_user(self, username: str, email: str, password_hash: str, role: str = "user") -> int:
         """Create a new user"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO users (username, email, password_hash, role, created_at)
@@ -922,7 +1242,7 @@ class AnalyticsDatabase:
     
     def get_user_by_username(self, username: str) -> Optional[User]:
         """Get user by username"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
             row = cursor.fetchone()
@@ -937,7 +1257,7 @@ class AnalyticsDatabase:
     
     def update_user_password(self, user_id: int, password_hash: str) -> bool:
         """Update user password"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "UPDATE users SET password_hash = ? WHERE id = ?",
@@ -948,7 +1268,7 @@ class AnalyticsDatabase:
     
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM users WHERE email = ?", (email,))
             row = cursor.fetchone()
@@ -963,7 +1283,7 @@ class AnalyticsDatabase:
     
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
             row = cursor.fetchone()
@@ -992,7 +1312,7 @@ class AnalyticsDatabase:
         
         params.append(user_id)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(f"""
                 UPDATE users 
@@ -1004,7 +1324,7 @@ class AnalyticsDatabase:
     
     def delete_user(self, user_id: int) -> bool:
         """Delete a user"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
             conn.commit()
@@ -1014,7 +1334,7 @@ class AnalyticsDatabase:
         """Create a daily snapshot of current metrics"""
         today = datetime.now().strftime('%Y-%m-%d')
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Get total videos
@@ -1069,7 +1389,7 @@ class AnalyticsDatabase:
 
     def get_daily_snapshots(self, days: int = 30) -> List[DailySnapshot]:
         """Get daily snapshots for the last N days"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT * FROM daily_snapshots 
@@ -3,16 +3,113 @@
 import asyncio
 import aiohttp
 import logging
-from typing import List, Dict, Optional, Any, Tuple
-from datetime import datetime, timedelta
+import math
+import os
+import random
+import re
+import time
+from collections import defaultdict
+from typing import List, Dict, Optional, Any, Tuple, Callable
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlencode
 
 from analytics.database import AnalyticsDatabase, VideoRecord, VideoMetrics
 from managers.oauth_manager import OAuthManager
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+YOUTUBE_SCOPES = [
+    'https://www.googleapis.com/auth/youtube.readonly',
+    'https://www.googleapis.com/auth/youtube.force-ssl',
+    'https://www.googleapis.com/auth/youtube.upload'
+]
+
+# ISO 8601 duration as returned by the YouTube API, e.g. PT1M5S or P1DT2H
+_YT_DURATION_RE = re.compile(r'P(?:(\d+)D)?T?(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+# HTTP statuses worth retrying with backoff (rate limits and transient server errors)
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+# Network failures worth retrying: the request never completed, and every call here is a read
+RETRYABLE_EXCEPTIONS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+# Upper bound on any single backoff, including server-sent Retry-After values
+MAX_BACKOFF_SECONDS = 60.0
+
+# Drop cached playlist/video pages that haven't been revalidated in this long
+ETAG_MAX_AGE_SECONDS = 30 * 24 * 3600
+
+# Short-lived cache for stats queries repeated by CLI/HTTP polling
+METRICS_CACHE_ENABLED = os.getenv("METRICS_CACHE_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+METRICS_CACHE_TTL_SECONDS = float(os.getenv("METRICS_CACHE_TTL_SECONDS", "30"))
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before the next attempt: Retry-After when usable, else jittered exponential backoff"""
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = None
+    if delay is None or not math.isfinite(delay) or delay < 0:
+        delay = 2 ** attempt + random.random()
+    return min(delay, MAX_BACKOFF_SECONDS)
+
+@lru_cache(maxsize=4096)
+def _parse_youtube_duration(duration_str: str) -> float:
+    """Parse YouTube duration string (PT1H2M3S) to seconds"""
+    match = _YT_DURATION_RE.match(duration_str)
+    if not match:
+        return 0.0
+    
+    days, hours, minutes, seconds = match.groups()
+    return float(int(days or 0) * 86400 + int(hours or 0) * 3600 + int(minutes or 0) * 60 + int(seconds or 0))
+
+def _parse_ts(ts: str) -> datetime:
+    """Parse a UTC API timestamp (2024-01-31T12:34:56Z or ...+0000) to an aware datetime"""
+    # Fixed-width fast path for the shapes YouTube and Instagram return
+    if len(ts) >= 20 and ts[19:] in ("Z", "+0000", "+00:00"):
+        try:
+            return datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                            int(ts[11:13]), int(ts[14:16]), int(ts[17:19]), tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    return datetime.fromisoformat(ts)
+
+class AsyncRateLimiter:
+    """Token-bucket limiter allowing max_rate acquisitions per time_period seconds"""
+    
+    def __init__(self, max_rate: float, time_period: float = 60):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._refill_rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available, then consume it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.max_rate, self._tokens + (now - self._last_refill) * self._refill_rate)
+                self._last_refill = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+@dataclass(slots=True)
 class ChannelVideo:
     """Video discovered from a channel"""
     platform: str
@@ -25,7 +122,7 @@ class ChannelVideo:
     thumbnail_url: str = ""
     metrics: Optional[Dict[str, Any]] = None  # Store raw metrics data
 
-@dataclass
+@dataclass(slots=True)
 class ChannelStats:
     """Aggregated channel statistics"""
     platform: str
@@ -43,117 +140,309 @@ class OAuthChannelDiscovery:
     def __init__(self, db: AnalyticsDatabase):
         self.db = db
         self.oauth_manager = OAuthManager()
+        # In-memory ETag tier in front of the on-disk etag_cache table
+        self._etag_cache: Dict[str, Tuple[str, Any]] = {}
+        # Per-platform cap on in-flight API requests
+        self._semaphores = {
+            "youtube": asyncio.Semaphore(4),
+            "instagram": asyncio.Semaphore(10),
+            "tiktok": asyncio.Semaphore(4)
+        }
+        # Request budgets for the Graph and TikTok APIs, to stay clear of 429s
+        self._limiters = {
+            "instagram": AsyncRateLimiter(180, 60),
+            "tiktok": AsyncRateLimiter(60, 60)
+        }
+        # Parsed OAuth credentials, reused across discovery calls until expired
+        self._creds_cache: Dict[str, Any] = {}
+        self._creds_locks = {platform: asyncio.Lock() for platform in self._semaphores}
+        # Shared HTTP session, created lazily so it binds to the running loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Stats query results keyed by query, as (monotonic timestamp, value)
+        self._metrics_cache: Dict[Any, Tuple[float, Any]] = {}
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=10,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
     
-    async def discover_youtube_channel_videos(self, max_results: int = 50) -> List[ChannelVideo]:
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _request_with_retry(self, platform: str, session: aiohttp.ClientSession, method: str,
+                                  url: str, *, max_retries: int = 5, **kwargs) -> aiohttp.ClientResponse:
+        """Issue a rate-limited HTTP request under the platform semaphore, backing off on 429/5xx,
+        connection errors and timeouts
+        
+        The response body is read before returning, so callers can use
+        ``.json()``/``.text()`` after the connection is released.
+        """
+        limiter = self._limiters.get(platform)
+        for attempt in range(max_retries + 1):
+            if limiter:
+                await limiter.acquire()
+            
+            try:
+                async with self._semaphores[platform]:
+                    response = await session.request(method, url, **kwargs)
+                    await response.read()
+            except RETRYABLE_EXCEPTIONS as e:
+                if attempt == max_retries:
+                    raise
+                delay = _retry_delay(attempt)
+                logger.warning(f"{platform} request failed ({e!r}), retrying in {delay:.1f}s ({attempt + 1}/{max_retries})")
+                await asyncio.sleep(delay)
+                continue
+            
+            if response.status not in RETRYABLE_STATUSES or attempt == max_retries:
+                return response
+            
+            delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+            logger.warning(f"{platform} request returned {response.status}, retrying in {delay:.1f}s ({attempt + 1}/{max_retries})")
+            await asyncio.sleep(delay)
+    
+    def _cached_metrics(self, key: Any, loader: Callable[[], Any]) -> Any:
+        """Return a stats query result from the TTL cache, loading it on a miss"""
+        if not METRICS_CACHE_ENABLED:
+            return loader()
+        
+        now = time.monotonic()
+        cached = self._metrics_cache.get(key)
+        if cached and now - cached[0] < METRICS_CACHE_TTL_SECONDS:
+            return cached[1]
+        
+        value = loader()
+        self._metrics_cache[key] = (now, value)
+        return value
+    
+    async def _get_youtube_creds(self):
+        """Get YouTube credentials, reading the token file only on first use"""
+        from google.auth.transport.requests import Request
+        
+        async with self._creds_locks["youtube"]:
+            creds = self._creds_cache.get("youtube")
+            if creds is None:
+                # Load directly from youtube_token.json to ensure we have all scopes
+                from google.oauth2.credentials import Credentials
+                
+                token_file = Path.home() / ".content_creation" / "youtube_token.json"
+                if not token_file.exists():
+                    logger.error("YouTube token file not found")
+                    return None
+                
+                # File read + JSON parse, keep it off the event loop
+                creds = await asyncio.to_thread(Credentials.from_authorized_user_file, str(token_file), YOUTUBE_SCOPES)
+                self._creds_cache["youtube"] = creds
+            
+            if not creds.valid and creds.refresh_token:
+                # Token refresh is a blocking HTTP call, keep it off the event loop
+                await asyncio.to_thread(creds.refresh, Request())
+            
+            return creds
+    
+    async def _get_platform_creds(self, platform: str):
+        """Get cached OAuth credentials for a platform, reloading once they expire"""
+        async with self._creds_locks[platform]:
+            creds = self._creds_cache.get(platform)
+            if creds is None or (creds.expires_at and creds.expires_at <= time.time()):
+                # get_credentials may refresh the token over HTTP, keep it off the event loop
+                creds = await asyncio.to_thread(self.oauth_manager.get_credentials, platform)
+                if creds:
+                    self._creds_cache[platform] = creds
+            
+            return creds
+    
+    async def _youtube_get(self, session: aiohttp.ClientSession, headers: Dict[str, str],
+                           resource: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """GET a YouTube Data API resource conditionally, reusing the cached body on 304"""
+        url = f"{YOUTUBE_API_URL}/{resource}"
+        cache_key = f"{url}?{urlencode(sorted(params.items()))}"
+        cached = self._etag_cache.get(cache_key) or await asyncio.to_thread(self.db.get_etag, cache_key)
+        
+        request_headers = dict(headers)
+        if cached:
+            request_headers["If-None-Match"] = cached[0]
+        
+        response = await self._request_with_retry("youtube", session, "GET", url, headers=request_headers, params=params)
+        if response.status == 304 and cached:
+            logger.debug(f"ETag hit, reusing cached response for {cache_key}")
+            self._etag_cache[cache_key] = cached
+            await asyncio.to_thread(self.db.touch_etag, cache_key)
+            return cached[1]
+        
+        if response.status != 200:
+            logger.error(f"YouTube {resource} error: {response.status} - {await response.text()}")
+            return None
+        
+        body = await response.json()
+        etag = response.headers.get("ETag") or body.get("etag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, body)
+            await asyncio.to_thread(self.db.set_etag, cache_key, etag, body)
+        
+        return body
+    
+    async def _youtube_playlist_page(self, session: aiohttp.ClientSession, headers: Dict[str, str],
+                                     playlist_id: str, page_token: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Fetch one full page of a YouTube playlist"""
+        params = {
+            "part": "snippet",
+            "playlistId": playlist_id,
+            "maxResults": 50
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        
+        return await self._youtube_get(session, headers, "playlistItems", params)
+    
+    async def _fetch_youtube_shorts(self, session: aiohttp.ClientSession, headers: Dict[str, str],
+                                    video_ids: List[str]) -> List[ChannelVideo]:
+        """Fetch details for the Shorts among a page of video IDs
+        
+        Durations are fetched first so snippet and statistics are only
+        requested for videos that pass the Shorts filter.
+        """
+        duration_response = await self._youtube_get(session, headers, "videos", {
+            "part": "contentDetails",
+            "id": ','.join(video_ids)
+        })
+        if not duration_response:
+            return []
+        
+        durations = {}
+        for video in duration_response['items']:
+            duration = _parse_youtube_duration(video['contentDetails']['duration'])
+            
+            # Only include YouTube Shorts (60 seconds or less)
+            if duration > 60:
+                logger.debug(f"⏭️  Skipping long-form video: {video['id']} ({duration}s)")
+                continue
+            
+            durations[video['id']] = duration
+        
+        if not durations:
+            return []
+        
+        video_response = await self._youtube_get(session, headers, "videos", {
+            "part": "snippet,statistics",
+            "id": ','.join(durations)
+        })
+        if not video_response:
+            return []
+        
+        shorts = []
+        for video in video_response['items']:
+            snippet = video['snippet']
+            statistics = video.get('statistics', {})
+            duration = durations[video['id']]
+            
+            # Extract statistics
+            views = int(statistics.get('viewCount', 0))
+            likes = int(statistics.get('likeCount', 0))
+            comments = int(statistics.get('commentCount', 0))
+            
+            logger.info(f"✅ YouTube Short: {snippet['title'][:50]}... - {views:,} views, {likes:,} likes ({duration}s)")
+            
+            shorts.append(ChannelVideo(
+                platform="youtube",
+                platform_video_id=video['id'],
+                title=snippet['title'],
+                description=snippet['description'],
+                published_at=_parse_ts(snippet['publishedAt']),
+                duration=duration,
+                platform_url=f"https://youtube.com/watch?v={video['id']}",
+                thumbnail_url=snippet['thumbnails'].get('high', {}).get('url', ''),
+                metrics={
+                    "views": views,
+                    "likes": likes,
+                    "comments": comments,
+                    "shares": 0  # YouTube doesn't provide share count
+                }
+            ))
+        
+        return shorts
+    
+    async def discover_youtube_channel_videos(self, max_results: int = 50,
+                                              skip_auth_check: bool = False) -> List[ChannelVideo]:
         """Discover videos from authenticated YouTube channel"""
-        if not self.oauth_manager.is_authenticated("youtube"):
+        if not skip_auth_check and not self.oauth_manager.is_authenticated("youtube"):
             logger.warning("YouTube not authenticated")
             return []
         
         try:
-            # Get YouTube service using OAuth credentials
-            # Load directly from youtube_token.json to ensure we have all scopes
-            from google.oauth2.credentials import Credentials
-            from googleapiclient.discovery import build
-            from pathlib import Path
-            import os
-            
-            # Try to load from token file directly (has all scopes)
-            token_file = Path.home() / ".content_creation" / "youtube_token.json"
-            
-            if not token_file.exists():
-                logger.error("YouTube token file not found")
+            creds = await self._get_youtube_creds()
+            if not creds:
                 return []
             
-            # Required scopes
-            SCOPES = [
-                'https://www.googleapis.com/auth/youtube.readonly',
-                'https://www.googleapis.com/auth/youtube.force-ssl',
-                'https://www.googleapis.com/auth/youtube.upload'
-            ]
-            
-            # Load credentials from token file
-            creds = Credentials.from_authorized_user_file(str(token_file), SCOPES)
+            headers = {"Authorization": f"Bearer {creds.token}"}
             
-            # Create YouTube service
-            youtube = build('youtube', 'v3', credentials=creds)
+            session = await self._get_session()
             
             # Get channel info
-            channel_response = youtube.channels().list(
-                part='contentDetails',
-                mine=True
-            ).execute()
+            channel_response = await self._youtube_get(session, headers, "channels", {
+                "part": "contentDetails",
+                "mine": "true"
+            })
             
-            if not channel_response.get('items'):
+            if not channel_response or not channel_response.get('items'):
                 logger.warning("No YouTube channel found")
                 return []
             
-            channel_id = channel_response['items'][0]['id']
             uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
             
             # Get videos from uploads playlist
             videos = []
-            next_page_token = None
-            
-            while len(videos) < max_results:
-                playlist_response = youtube.playlistItems().list(
-                    part='snippet',
-                    playlistId=uploads_playlist_id,
-                    maxResults=min(50, max_results - len(videos)),
-                    pageToken=next_page_token
-                ).execute()
-                
-                video_ids = [item['snippet']['resourceId']['videoId'] for item in playlist_response['items']]
-                
-                if not video_ids:
-                    break
-                
-                # Get video details
-                video_response = youtube.videos().list(
-                    part='snippet,contentDetails,statistics',
-                    id=','.join(video_ids)
-                ).execute()
-                
-                for video in video_response['items']:
-                    snippet = video['snippet']
-                    content_details = video['contentDetails']
-                    statistics = video.get('statistics', {})
-                    
-                    # Parse duration
-                    duration = self._parse_youtube_duration(content_details['duration'])
-                    
-                    # Only include YouTube Shorts (60 seconds or less)
-                    if duration > 60:
-                        logger.debug(f"⏭️  Skipping long-form video: {snippet['title'][:50]}... ({duration}s)")
-                        continue
-                    
-                    # Extract statistics
-                    views = int(statistics.get('viewCount', 0))
-                    likes = int(statistics.get('likeCount', 0))
-                    comments = int(statistics.get('commentCount', 0))
+            page_task = asyncio.create_task(
+                self._youtube_playlist_page(session, headers, uploads_playlist_id, None)
+            )
+            
+            try:
+                while page_task and len(videos) < max_results:
+                    # Walk playlist pages until enough IDs are queued for this round,
+                    # starting each page's video details request as soon as its IDs are known
+                    remaining = max_results - len(videos)
+                    queued = 0
+                    detail_tasks = []
                     
-                    logger.info(f"✅ YouTube Short: {snippet['title'][:50]}... - {views:,} views, {likes:,} likes ({duration}s)")
+                    while page_task and queued < remaining:
+                        playlist_response = await page_task
+                        page_task = None
+                        video_ids = [
+                            item['snippet']['resourceId']['videoId']
+                            for item in (playlist_response or {}).get('items', [])
+                        ]
+                        
+                        if not video_ids:
+                            break
+                        
+                        # Prefetch the next page while this page's details are in flight
+                        next_page_token = playlist_response.get('nextPageToken')
+                        if next_page_token:
+                            page_task = asyncio.create_task(
+                                self._youtube_playlist_page(session, headers, uploads_playlist_id, next_page_token)
+                            )
+                        
+                        queued += len(video_ids)
+                        detail_tasks.append(asyncio.create_task(self._fetch_youtube_shorts(session, headers, video_ids)))
                     
-                    videos.append(ChannelVideo(
-                        platform="youtube",
-                        platform_video_id=video['id'],
-                        title=snippet['title'],
-                        description=snippet['description'],
-                        published_at=datetime.fromisoformat(snippet['publishedAt'].replace('Z', '+00:00')),
-                        duration=duration,
-                        platform_url=f"https://youtube.com/watch?v={video['id']}",
-                        thumbnail_url=snippet['thumbnails'].get('high', {}).get('url', ''),
-                        metrics={
-                            "views": views,
-                            "likes": likes,
-                            "comments": comments,
-                            "shares": 0  # YouTube doesn't provide share count
-                        }
-                    ))
+                    for shorts in await asyncio.gather(*detail_tasks):
+                        videos.extend(shorts[:max_results - len(videos)])
                 
-                next_page_token = playlist_response.get('nextPageToken')
-                if not next_page_token:
-                    break
+            finally:
+                if page_task:
+                    page_task.cancel()
             
             logger.info(f"Discovered {len(videos)} YouTube videos")
             return videos
@@ -162,323 +451,328 @@ class OAuthChannelDiscovery:
             logger.error(f"Error discovering YouTube videos: {e}")
             return []
     
-    def _parse_youtube_duration(self, duration_str: str) -> float:
-        """Parse YouTube duration string (PT1H2M3S) to seconds"""
-        import re
-        
-        # Remove PT prefix
-        duration_str = duration_str[2:]
-        
-        # Parse hours, minutes, seconds
-        hours = re.search(r'(\d+)H', duration_str)
-        minutes = re.search(r'(\d+)M', duration_str)
-        seconds = re.search(r'(\d+)S', duration_str)
-        
-        total_seconds = 0
-        if hours:
-            total_seconds += int(hours.group(1)) * 3600
-        if minutes:
-            total_seconds += int(minutes.group(1)) * 60
-        if seconds:
-            total_seconds += int(seconds.group(1))
-        
-        return float(total_seconds)
-    
-    async def discover_instagram_videos(self, max_results: int = 50) -> List[ChannelVideo]:
+    async def discover_instagram_videos(self, max_results: int = 50,
+                                        skip_auth_check: bool = False) -> List[ChannelVideo]:
         """Discover videos from authenticated Instagram account with metrics"""
-        if not self.oauth_manager.is_authenticated("instagram"):
+        if not skip_auth_check and not self.oauth_manager.is_authenticated("instagram"):
             logger.warning("Instagram not authenticated")
             return []
         
         try:
-            creds = self.oauth_manager.get_credentials("instagram")
+            creds = await self._get_platform_creds("instagram")
             if not creds:
                 return []
             
-            async with aiohttp.ClientSession() as session:
-                # Get user info first
-                user_url = f"https://graph.instagram.com/me"
-                params = {
-                    "fields": "id,username",
-                    "access_token": creds.access_token
-                }
+            session = await self._get_session()
+            
+            # Get user info first
+            user_url = f"https://graph.instagram.com/me"
+            params = {
+                "fields": "id,username",
+                "access_token": creds.access_token
+            }
+            
+            response = await self._request_with_retry("instagram", session, "GET", user_url, params=params)
+            if response.status != 200:
+                logger.error(f"Instagram user info error: {response.status}")
+                return []
+            
+            user_data = await response.json()
+            user_id = user_data['id']
+            
+            # Get user's media with basic info
+            media_url = f"https://graph.instagram.com/{user_id}/media"
+            params = {
+                "fields": "id,caption,media_type,media_url,permalink,timestamp,thumbnail_url,"
+                          "like_count,comments_count,children{media_type}",
+                "limit": max_results,
+                "access_token": creds.access_token
+            }
+            
+            response = await self._request_with_retry("instagram", session, "GET", media_url, params=params)
+            if response.status != 200:
+                logger.error(f"Instagram media error: {response.status}")
+                return []
+            
+            data = await response.json()
+            
+            # Only include video content; fetch per-media insights concurrently
+            # (bounded by the shared Instagram semaphore)
+            results = await asyncio.gather(*(
+                self._fetch_instagram_media(session, item, creds.access_token)
+                for item in data.get("data", [])
+                if self._is_instagram_video(item)
+            ), return_exceptions=True)
+            
+            videos = []
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning(f"❌ Error processing Instagram media: {result}")
+                    continue
+                videos.append(result)
+            
+            logger.info(f"Discovered {len(videos)} Instagram videos with metrics")
+            return videos
                 
-                async with session.get(user_url, params=params) as response:
-                    if response.status != 200:
-                        logger.error(f"Instagram user info error: {response.status}")
-                        return []
-                    
-                    user_data = await response.json()
-                    user_id = user_data['id']
+        except Exception as e:
+            logger.error(f"Error discovering Instagram videos: {e}")
+            return []
+    
+    def _is_instagram_video(self, item: Dict[str, Any]) -> bool:
+        """Check whether a media item is video content (carousels need a video child)"""
+        media_type = item.get("media_type")
+        if media_type == "CAROUSEL_ALBUM":
+            children = item.get("children", {}).get("data", [])
+            return any(child.get("media_type") == "VIDEO" for child in children)
+        return media_type in ("VIDEO", "REELS")
+    
+    async def _fetch_instagram_media(self, session: aiohttp.ClientSession, item: Dict[str, Any],
+                                     access_token: str) -> ChannelVideo:
+        """Fetch insights for a single Instagram media item"""
+        media_id = item["id"]
+        
+        # Fetch insights for this media using Instagram Insights API
+        # Reference: https://developers.facebook.com/docs/instagram-platform/insights/
+        # Using graph.instagram.com for Instagram Business Login tokens
+        media_metrics = {}
+        try:
+            # Likes and comments come with the media list response
+            likes = item.get("like_count", 0)
+            comments = item.get("comments_count", 0)
+            
+            # Now get insights (impressions, reach) using the Insights API
+            # For videos/reels, we'll use impressions/plays as views
+            # For images, we'll use reach
+            insights_url = f"https://graph.instagram.com/{media_id}/insights"
+            
+            # Different metrics available based on media type
+            # Instagram is very strict about which metrics work with which media types
+            # SAFEST: reach, saved (work for most types)
+            # REELS only: plays
+            # FEED only: impressions
+            
+            # Start with the safest metrics that work for all types
+            metrics = "reach,saved"
+            
+            insights_params = {
+                "metric": metrics,
+                "access_token": access_token
+            }
+            
+            views = 0
+            insights_response = await self._request_with_retry("instagram", session, "GET", insights_url, params=insights_params)
+            if insights_response.status == 200:
+                insights_data = await insights_response.json()
                 
-                # Get user's media with basic info
-                media_url = f"https://graph.instagram.com/{user_id}/media"
-                params = {
-                    "fields": "id,caption,media_type,media_url,permalink,timestamp,thumbnail_url",
-                    "limit": max_results,
-                    "access_token": creds.access_token
+                # Index insights by metric name once
+                by_name = {
+                    insight.get("name"): (insight.get("values") or [{}])[0].get("value", 0)
+                    for insight in insights_data.get("data", [])
                 }
                 
-                async with session.get(media_url, params=params) as response:
-                    if response.status != 200:
-                        logger.error(f"Instagram media error: {response.status}")
-                        return []
-                    
-                    data = await response.json()
-                    videos = []
-                    
-                    for item in data.get("data", []):
-                        # Only include video content
-                        media_type = item.get("media_type")
-                        if media_type in ["VIDEO", "REELS", "CAROUSEL_ALBUM"]:
-                            media_id = item["id"]
-                            
-                            # Fetch insights for this media using Instagram Insights API
-                            # Reference: https://developers.facebook.com/docs/instagram-platform/insights/
-                            # Using graph.instagram.com for Instagram Business Login tokens
-                            media_metrics = {}
-                            try:
-                                # First get basic info (likes, comments) from the media object
-                                info_url = f"https://graph.instagram.com/{media_id}"
-                                info_params = {
-                                    "fields": "like_count,comments_count,media_type",
-                                    "access_token": creds.access_token
-                                }
-                                
-                                likes = 0
-                                comments = 0
-                                actual_media_type = media_type
-                                
-                                async with session.get(info_url, params=info_params) as info_response:
-                                    if info_response.status == 200:
-                                        info_data = await info_response.json()
-                                        likes = info_data.get("like_count", 0)
-                                        comments = info_data.get("comments_count", 0)
-                                        actual_media_type = info_data.get("media_type", media_type)
-                                
-                                # Now get insights (impressions, reach) using the Insights API
-                                # For videos/reels, we'll use impressions/plays as views
-                                # For images, we'll use reach
-                                insights_url = f"https://graph.instagram.com/{media_id}/insights"
-                                
-                                # Different metrics available based on media type
-                                # Instagram is very strict about which metrics work with which media types
-                                # SAFEST: reach, saved (work for most types)
-                                # REELS only: plays
-                                # FEED only: impressions
-                                
-                                # Start with the safest metrics that work for all types
-                                metrics = "reach,saved"
-                                
-                                insights_params = {
-                                    "metric": metrics,
-                                    "access_token": creds.access_token
-                                }
-                                
-                                views = 0
-                                async with session.get(insights_url, params=insights_params) as insights_response:
-                                    if insights_response.status == 200:
-                                        insights_data = await insights_response.json()
-                                        
-                                        # Parse insights data
-                                        for insight in insights_data.get("data", []):
-                                            insight_name = insight.get("name")
-                                            values = insight.get("values", [{}])
-                                            value = values[0].get("value", 0) if values else 0
-                                            
-                                            # Priority order: plays (for reels/videos), impressions, reach
-                                            if insight_name == "plays" and value > 0:
-                                                views = value
-                                            # Use impressions as the "view" metric if plays not available
-                                            elif insight_name == "impressions" and views == 0:
-                                                views = value
-                                            # Fall back to reach if neither plays nor impressions available
-                                            elif insight_name == "reach" and views == 0:
-                                                views = value
-                                        
-                                        logger.info(f"✅ Instagram insights for {media_id}: {views:,} views, {likes:,} likes, {comments:,} comments")
-                                    else:
-                                        logger.warning(f"⚠️  Could not fetch insights for {media_id}, status: {insights_response.status}")
-                                        error_text = await insights_response.text()
-                                        logger.warning(f"Error: {error_text}")
-                                        # If insights fail, at least we have likes/comments
-                                        logger.info(f"📊 Instagram basic metrics for {media_id}: {likes:,} likes, {comments:,} comments (no views)")
-                                
-                                media_metrics = {
-                                    "views": views,
-                                    "likes": likes,
-                                    "comments": comments,
-                                    "shares": 0  # Instagram doesn't provide share count via API
-                                }
-                                
-                            except Exception as e:
-                                logger.warning(f"❌ Error fetching metrics for {media_id}: {e}")
-                                media_metrics = {
-                                    "views": 0,
-                                    "likes": 0,
-                                    "comments": 0,
-                                    "shares": 0
-                                }
-                            
-                            videos.append(ChannelVideo(
-                                platform="instagram",
-                                platform_video_id=media_id,
-                                title=item.get("caption", "")[:100] or "Instagram Video",
-                                description=item.get("caption", ""),
-                                published_at=datetime.fromisoformat(item["timestamp"].replace('Z', '+00:00')),
-                                duration=0,  # Instagram doesn't provide duration in basic API
-                                platform_url=item.get("permalink", ""),
-                                thumbnail_url=item.get("thumbnail_url", ""),
-                                metrics=media_metrics  # Store metrics for syncing
-                            ))
-                    
-                    logger.info(f"Discovered {len(videos)} Instagram videos with metrics")
-                    return videos
-                    
+                # Priority order: plays (for reels/videos), impressions, reach
+                views = by_name.get("plays") or by_name.get("impressions") or by_name.get("reach") or 0
+                
+                logger.info(f"✅ Instagram insights for {media_id}: {views:,} views, {likes:,} likes, {comments:,} comments")
+            else:
+                logger.warning(f"⚠️  Could not fetch insights for {media_id}, status: {insights_response.status}")
+                error_text = await insights_response.text()
+                logger.warning(f"Error: {error_text}")
+                # If insights fail, at least we have likes/comments
+                logger.info(f"📊 Instagram basic metrics for {media_id}: {likes:,} likes, {comments:,} comments (no views)")
+            
+            media_metrics = {
+                "views": views,
+                "likes": likes,
+                "comments": comments,
+                "shares": 0  # Instagram doesn't provide share count via API
+            }
+            
         except Exception as e:
-            logger.error(f"Error discovering Instagram videos: {e}")
-            return []
+            logger.warning(f"❌ Error fetching metrics for {media_id}: {e}")
+            media_metrics = {
+                "views": 0,
+                "likes": 0,
+                "comments": 0,
+                "shares": 0
+            }
+        
+        return ChannelVideo(
+            platform="instagram",
+            platform_video_id=media_id,
+            title=item.get("caption", "")[:100] or "Instagram Video",
+            description=item.get("caption", ""),
+            published_at=_parse_ts(item["timestamp"]),
+            duration=0,  # Instagram doesn't provide duration in basic API
+            platform_url=item.get("permalink", ""),
+            thumbnail_url=item.get("thumbnail_url", ""),
+            metrics=media_metrics  # Store metrics for syncing
+        )
     
-    async def discover_tiktok_videos(self, max_results: int = 50) -> List[ChannelVideo]:
+    async def discover_tiktok_videos(self, max_results: int = 50,
+                                     skip_auth_check: bool = False) -> List[ChannelVideo]:
         """Discover videos from authenticated TikTok account"""
-        if not self.oauth_manager.is_authenticated("tiktok"):
+        if not skip_auth_check and not self.oauth_manager.is_authenticated("tiktok"):
             logger.warning("TikTok not authenticated")
             return []
         
         try:
-            creds = self.oauth_manager.get_credentials("tiktok")
+            creds = await self._get_platform_creds("tiktok")
             if not creds:
                 return []
             
-            async with aiohttp.ClientSession() as session:
-                # Get user info first
-                user_url = "https://open.tiktokapis.com/v2/user/info/"
-                headers = {
-                    "Authorization": f"Bearer {creds.access_token}",
-                    "Content-Type": "application/json"
-                }
-                user_params = {
-                    "fields": "open_id,union_id,avatar_url,display_name,bio_description"
+            session = await self._get_session()
+            
+            # Get user info first
+            user_url = "https://open.tiktokapis.com/v2/user/info/"
+            headers = {
+                "Authorization": f"Bearer {creds.access_token}",
+                "Content-Type": "application/json"
+            }
+            user_params = {
+                "fields": "open_id,union_id,avatar_url,display_name,bio_description"
+            }
+            
+            response = await self._request_with_retry("tiktok", session, "GET", user_url, headers=headers, params=user_params)
+            if response.status != 200:
+                logger.error(f"TikTok user info error: {response.status}")
+                try:
+                    error_data = await response.json()
+                    logger.error(f"TikTok user info error details: {error_data}")
+                except:
+                    logger.error(f"TikTok user info error text: {await response.text()}")
+                return []
+            
+            user_data = await response.json()
+            logger.info(f"TikTok user data: {user_data}")
+            user_id = user_data['data']['user']['open_id']
+            
+            # First get video list to get video IDs
+            videos_url = "https://open.tiktokapis.com/v2/video/list/"
+            headers = {
+                "Authorization": f"Bearer {creds.access_token}",
+                "Content-Type": "application/json"
+            }
+            
+            # Get basic video list first
+            params = {
+                "fields": "id,title,create_time"
+            }
+            
+            # Page through the video list, starting each page's detail query as
+            # soon as its IDs arrive so list paging and detail lookups overlap
+            query_tasks = []
+            listed = 0
+            cursor = None
+            
+            while listed < max_results:
+                data = {
+                    "max_count": min(max_results - listed, 20)  # TikTok API limit is 20
                 }
+                if cursor:
+                    data["cursor"] = cursor
                 
-                async with session.get(user_url, headers=headers, params=user_params) as response:
-                    if response.status != 200:
-                        logger.error(f"TikTok user info error: {response.status}")
-                        try:
-                            error_data = await response.json()
-                            logger.error(f"TikTok user info error details: {error_data}")
-                        except:
-                            logger.error(f"TikTok user info error text: {await response.text()}")
-                        return []
-                    
-                    user_data = await response.json()
-                    logger.info(f"TikTok user data: {user_data}")
-                    user_id = user_data['data']['user']['open_id']
+                response = await self._request_with_retry("tiktok", session, "POST", videos_url, headers=headers, json=data, params=params)
+                if response.status != 200:
+                    logger.error(f"TikTok videos error: {response.status}")
+                    try:
+                        error_data = await response.json()
+                        logger.error(f"TikTok videos error details: {error_data}")
+                    except:
+                        logger.error(f"TikTok videos error text: {await response.text()}")
+                    break
                 
-                # First get video list to get video IDs
-                videos_url = "https://open.tiktokapis.com/v2/video/list/"
-                headers = {
-                    "Authorization": f"Bearer {creds.access_token}",
-                    "Content-Type": "application/json"
-                }
+                list_data = await response.json()
+                logger.info(f"TikTok videos list response: {list_data}")
                 
-                # Get basic video list first
-                params = {
-                    "fields": "id,title,create_time"
-                }
+                # Extract video IDs for detailed query
+                page = list_data.get("data", {})
+                video_ids = [item["id"] for item in page.get("videos", [])]
+                if not video_ids:
+                    break
                 
-                data = {
-                    "max_count": min(max_results, 20)  # TikTok API limit is 20
-                }
+                listed += len(video_ids)
+                query_tasks.append(asyncio.create_task(self._query_tiktok_videos(session, headers, video_ids)))
+                
+                cursor = page.get("cursor")
+                if not page.get("has_more") or not cursor:
+                    break
+            
+            if not query_tasks:
+                logger.info("No TikTok videos found")
+                return []
+            
+            all_videos = []
+            for result in await asyncio.gather(*query_tasks, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"TikTok video query failed: {result}")
+                    continue
+                all_videos.extend(result)
+            
+            logger.info(f"Discovered {len(all_videos)} TikTok videos with detailed metrics")
+            return all_videos
                 
-                async with session.post(videos_url, headers=headers, json=data, params=params) as response:
-                    if response.status != 200:
-                        logger.error(f"TikTok videos error: {response.status}")
-                        try:
-                            error_data = await response.json()
-                            logger.error(f"TikTok videos error details: {error_data}")
-                        except:
-                            logger.error(f"TikTok videos error text: {await response.text()}")
-                        return []
-                    
-                    list_data = await response.json()
-                    logger.info(f"TikTok videos list response: {list_data}")
-                    
-                    # Extract video IDs for detailed query
-                    video_ids = [item["id"] for item in list_data.get("data", {}).get("videos", [])]
-                    
-                    if not video_ids:
-                        logger.info("No TikTok videos found")
-                        return []
-                    
-                    # Now query detailed video information including metrics
-                    query_url = "https://open.tiktokapis.com/v2/video/query/"
-                    query_params = {
-                        "fields": "id,title,create_time,duration,cover_image_url,share_url,video_description,like_count,comment_count,share_count,view_count"
-                    }
-                    
-                    # Process videos in batches of 20 (TikTok API limit)
-                    all_videos = []
-                    for i in range(0, len(video_ids), 20):
-                        batch_ids = video_ids[i:i+20]
-                        
-                        query_data = {
-                            "filters": {
-                                "video_ids": batch_ids
-                            }
-                        }
-                        
-                        async with session.post(query_url, headers=headers, json=query_data, params=query_params) as query_response:
-                            if query_response.status != 200:
-                                logger.error(f"TikTok video query error: {query_response.status}")
-                                try:
-                                    error_data = await query_response.json()
-                                    logger.error(f"TikTok video query error details: {error_data}")
-                                except:
-                                    logger.error(f"TikTok video query error text: {await query_response.text()}")
-                                continue
-                            
-                            query_result = await query_response.json()
-                            logger.info(f"TikTok video query response: {query_result}")
-                            
-                            for item in query_result.get("data", {}).get("videos", []):
-                                all_videos.append(ChannelVideo(
-                                    platform="tiktok",
-                                    platform_video_id=item["id"],
-                                    title=item.get("title", "") or "TikTok Video",
-                                    description=item.get("video_description", ""),
-                                    published_at=datetime.fromtimestamp(item.get("create_time", 0) / 1000),
-                                    duration=float(item.get("duration", 0)),
-                                    platform_url=item.get("share_url", ""),
-                                    thumbnail_url=item.get("cover_image_url", ""),
-                                    # Store metrics for later use
-                                    metrics={
-                                        "views": item.get("view_count", 0),
-                                        "likes": item.get("like_count", 0),
-                                        "comments": item.get("comment_count", 0),
-                                        "shares": item.get("share_count", 0)
-                                    }
-                                ))
-                    
-                    logger.info(f"Discovered {len(all_videos)} TikTok videos with detailed metrics")
-                    return all_videos
-                    
         except Exception as e:
             logger.error(f"Error discovering TikTok videos: {e}")
             return []
     
+    async def _query_tiktok_videos(self, session: aiohttp.ClientSession, headers: Dict[str, str],
+                                   video_ids: List[str]) -> List[ChannelVideo]:
+        """Query detailed video information including metrics for up to 20 TikTok videos"""
+        query_url = "https://open.tiktokapis.com/v2/video/query/"
+        query_params = {
+            "fields": "id,title,create_time,duration,cover_image_url,share_url,video_description,like_count,comment_count,share_count,view_count"
+        }
+        query_data = {
+            "filters": {
+                "video_ids": video_ids
+            }
+        }
+        
+        query_response = await self._request_with_retry("tiktok", session, "POST", query_url, headers=headers, json=query_data, params=query_params)
+        if query_response.status != 200:
+            logger.error(f"TikTok video query error: {query_response.status}")
+            try:
+                error_data = await query_response.json()
+                logger.error(f"TikTok video query error details: {error_data}")
+            except:
+                logger.error(f"TikTok video query error text: {await query_response.text()}")
+            return []
+        
+        query_result = await query_response.json()
+        logger.info(f"TikTok video query response: {query_result}")
+        
+        videos = []
+        for item in query_result.get("data", {}).get("videos", []):
+            videos.append(ChannelVideo(
+                platform="tiktok",
+                platform_video_id=item["id"],
+                title=item.get("title", "") or "TikTok Video",
+                description=item.get("video_description", ""),
+                published_at=datetime.fromtimestamp(item.get("create_time", 0) / 1000),
+                duration=float(item.get("duration", 0)),
+                platform_url=item.get("share_url", ""),
+                thumbnail_url=item.get("cover_image_url", ""),
+                # Store metrics for later use
+                metrics={
+                    "views": item.get("view_count", 0),
+                    "likes": item.get("like_count", 0),
+                    "comments": item.get("comment_count", 0),
+                    "shares": item.get("share_count", 0)
+                }
+            ))
+        
+        return videos
+    
     async def sync_all_authenticated_channels(self, max_results: int = 50) -> Dict[str, List[ChannelVideo]]:
         """Sync videos from all authenticated channels"""
         results = {}
         
-        # Check which platforms are authenticated
-        authenticated_platforms = []
-        if self.oauth_manager.is_authenticated("youtube"):
-            authenticated_platforms.append("youtube")
-        if self.oauth_manager.is_authenticated("instagram"):
-            authenticated_platforms.append("instagram")
-        if self.oauth_manager.is_authenticated("tiktok"):
-            authenticated_platforms.append("tiktok")
+        # Check which platforms are authenticated (once per sync)
+        authenticated_platforms = [
+            platform for platform in ("youtube", "instagram", "tiktok")
+            if self.oauth_manager.is_authenticated(platform)
+        ]
         
         if not authenticated_platforms:
             logger.warning("No platforms authenticated")
@@ -486,162 +780,164 @@ class OAuthChannelDiscovery:
         
         logger.info(f"Syncing videos from authenticated platforms: {', '.join(authenticated_platforms)}")
         
-        # Discover videos from each platform
         if "youtube" in authenticated_platforms:
-            videos = await self.discover_youtube_channel_videos(max_results)
-            results["youtube"] = videos
-            await self._sync_videos_to_db(videos)
+            pruned = await asyncio.to_thread(self.db.prune_etags, ETAG_MAX_AGE_SECONDS)
+            if pruned:
+                logger.debug(f"Pruned {pruned} stale ETag cache entries")
         
-        if "instagram" in authenticated_platforms:
-            videos = await self.discover_instagram_videos(max_results)
-            results["instagram"] = videos
-            await self._sync_videos_to_db(videos)
+        # Discover videos from each platform concurrently
+        discover = {
+            "youtube": self.discover_youtube_channel_videos,
+            "instagram": self.discover_instagram_videos,
+            "tiktok": self.discover_tiktok_videos
+        }
+        try:
+            tasks = {
+                platform: asyncio.create_task(discover[platform](max_results, skip_auth_check=True))
+                for platform in authenticated_platforms
+            }
+            results = dict(zip(tasks, await asyncio.gather(*tasks.values())))
+        finally:
+            await self.close()
+        
+        # Sync each platform's videos to the database concurrently as well
+        await asyncio.gather(*(self._sync_videos_to_db(videos) for videos in results.values()))
         
-        if "tiktok" in authenticated_platforms:
-            videos = await self.discover_tiktok_videos(max_results)
-            results["tiktok"] = videos
-            await self._sync_videos_to_db(videos)
+        # Stats computed before this sync are stale now
+        self._metrics_cache.clear()
         
         return results
     
     async def _sync_videos_to_db(self, videos: List[ChannelVideo]):
         """Sync discovered videos to the database"""
+        if not videos:
+            return
+        
+        # One existence query and one latest-metrics query for the whole batch
+        existing_ids = await asyncio.to_thread(
+            self.db.get_existing_video_ids,
+            [video.platform_video_id for video in videos]
+        )
+        # Latest stored counts, so unchanged metrics don't add a new row every sync
+        latest_metrics = await asyncio.to_thread(
+            self.db.get_latest_metrics_bulk,
+            [(video.platform_video_id, video.platform) for video in videos if video.metrics]
+        )
+        
+        new_records = []
+        new_metrics = []
         for video in videos:
-            # Check if video already exists
-            existing = self.db.get_video(video.platform_video_id)
-            if existing:
-                # Update metrics if available
-                if video.metrics:
-                    await self._update_video_metrics(video.platform_video_id, video.metrics, video.platform)
-                continue
-            
-            # Create video record
-            video_record = VideoRecord(
-                video_id=video.platform_video_id,
-                title=video.title,
-                description=video.description,
-                platform=video.platform,
-                platform_video_id=video.platform_video_id,
-                platform_url=video.platform_url,
-                duration=video.duration,
-                file_path="",  # Not available for discovered videos
-                created_at=video.published_at,
-                status="published"  # Assume published if discovered
-            )
+            if video.platform_video_id not in existing_ids:
+                new_records.append(VideoRecord(
+                    video_id=video.platform_video_id,
+                    title=video.title,
+                    description=video.description,
+                    platform=video.platform,
+                    platform_video_id=video.platform_video_id,
+                    platform_url=video.platform_url,
+                    duration=video.duration,
+                    file_path="",  # Not available for discovered videos
+                    created_at=video.published_at,
+                    status="published"  # Assume published if discovered
+                ))
             
-            try:
-                self.db.add_video(video_record)
-                logger.info(f"Synced video: {video.title} ({video.platform})")
-                
-                # Add metrics if available (e.g., from TikTok)
-                if video.metrics:
-                    await self._update_video_metrics(video.platform_video_id, video.metrics, video.platform)
-                    
-            except Exception as e:
-                logger.error(f"Failed to sync video {video.platform_video_id}: {e}")
-    
-    async def _update_video_metrics(self, video_id: str, metrics: Dict[str, Any], platform: str = "tiktok"):
-        """Update video metrics in the database"""
+            # Add metrics if available and changed since the last sync
+            if video.metrics and self._metrics_changed(video, latest_metrics):
+                new_metrics.append(self._build_video_metrics(video.platform_video_id, video.metrics, video.platform))
+        
         try:
-            views = metrics.get("views", 0)
-            likes = metrics.get("likes", 0)
-            comments = metrics.get("comments", 0)
-            shares = metrics.get("shares", 0)
-            
-            # Calculate engagement rate
-            engagement_rate = 0.0
-            if views > 0:
-                engagement_rate = (likes + comments) / views
-            
-            # Create VideoMetrics record
-            video_metrics = VideoMetrics(
-                video_id=video_id,
-                platform=platform,
-                views=views,
-                likes=likes,
-                shares=shares,
-                comments=comments,
-                engagement_rate=engagement_rate,
-                collected_at=datetime.now()
-            )
-            
-            self.db.add_metrics(video_metrics)
-            logger.debug(f"Updated metrics for video {video_id}: {metrics} (engagement: {engagement_rate:.2%})")
-            
+            await asyncio.to_thread(self.db.add_videos_bulk, new_records)
+            await asyncio.to_thread(self.db.add_metrics_bulk, new_metrics)
         except Exception as e:
-            logger.error(f"Failed to update metrics for video {video_id}: {e}")
+            logger.error(f"Failed to sync {videos[0].platform} videos: {e}")
+            return
+        
+        for record in new_records:
+            logger.info(f"Synced video: {record.title} ({record.platform})")
+        logger.debug(f"Stored {len(new_metrics)} metrics updates for {videos[0].platform}")
+    
+    def _metrics_changed(self, video: ChannelVideo,
+                         latest_metrics: Dict[Tuple[str, str], VideoMetrics]) -> bool:
+        """Check whether discovered metrics differ from the latest stored row"""
+        latest = latest_metrics.get((video.platform_video_id, video.platform))
+        if latest is None:
+            return True
+        
+        return (latest.views, latest.likes, latest.shares, latest.comments) != (
+            video.metrics.get("views", 0),
+            video.metrics.get("likes", 0),
+            video.metrics.get("shares", 0),
+            video.metrics.get("comments", 0)
+        )
+    
+    def _build_video_metrics(self, video_id: str, metrics: Dict[str, Any], platform: str = "tiktok") -> VideoMetrics:
+        """Build a VideoMetrics record from discovered metrics"""
+        views = metrics.get("views", 0)
+        likes = metrics.get("likes", 0)
+        comments = metrics.get("comments", 0)
+        shares = metrics.get("shares", 0)
+        
+        # Calculate engagement rate
+        engagement_rate = 0.0
+        if views > 0:
+            engagement_rate = (likes + comments) / views
+        
+        return VideoMetrics(
+            video_id=video_id,
+            platform=platform,
+            views=views,
+            likes=likes,
+            shares=shares,
+            comments=comments,
+            engagement_rate=engagement_rate,
+            collected_at=datetime.now()
+        )
     
     async def get_aggregated_channel_stats(self) -> Dict[str, ChannelStats]:
         """Get aggregated statistics for all channels"""
         stats = {}
         
-        # Get all published videos from database
-        all_videos = self.db.list_videos(status="published")
-        
-        # Group by platform
-        platform_videos = {}
-        for video in all_videos:
-            if video.platform not in platform_videos:
-                platform_videos[video.platform] = []
-            platform_videos[video.platform].append(video)
-        
-        # Calculate stats for each platform
-        for platform, videos in platform_videos.items():
-            total_views = 0
-            total_likes = 0
-            total_shares = 0
-            total_comments = 0
-            engagement_rates = []
+        # Totals per platform are computed in SQL (YouTube Shorts only)
+        aggregates = self._cached_metrics(
+            ("aggregates", "published"),
+            lambda: self.db.get_channel_aggregates(status="published")
+        )
+        
+        for platform, totals in aggregates.items():
+            # Track most popular video with metrics
             most_popular_video = None
-            max_views = 0
-            counted_videos = 0
-            
-            for video in videos:
-                # For YouTube, only count Shorts (60 seconds or less)
-                if platform == "youtube" and video.duration > 60:
-                    continue
-                
-                counted_videos += 1
-                
-                # Get latest metrics
-                metrics = self.db.get_latest_metrics(video.video_id, platform)
-                if metrics:
-                    total_views += metrics.views
-                    total_likes += metrics.likes
-                    total_shares += metrics.shares
-                    total_comments += metrics.comments
-                    engagement_rates.append(metrics.engagement_rate)
-                    
-                    # Track most popular video with metrics
-                    if metrics.views > max_views:
-                        max_views = metrics.views
-                        metrics_dict = {
-                            "views": metrics.views,
-                            "likes": metrics.likes,
-                            "comments": metrics.comments,
-                            "shares": metrics.shares
-                        }
-                        most_popular_video = ChannelVideo(
-                            platform=platform,
-                            platform_video_id=video.platform_video_id,
-                            title=video.title,
-                            description=video.description,
-                            published_at=video.created_at,
-                            duration=video.duration,
-                            platform_url=video.platform_url,
-                            metrics=metrics_dict
-                        )
-            
-            avg_engagement = sum(engagement_rates) / len(engagement_rates) if engagement_rates else 0.0
+            popular = self._cached_metrics(
+                ("most_popular", platform, "published"),
+                lambda platform=platform: self.db.get_most_popular_video(platform, status="published")
+            )
+            if popular:
+                video, metrics = popular
+                if metrics.views > 0:
+                    metrics_dict = {
+                        "views": metrics.views,
+                        "likes": metrics.likes,
+                        "comments": metrics.comments,
+                        "shares": metrics.shares
+                    }
+                    most_popular_video = ChannelVideo(
+                        platform=platform,
+                        platform_video_id=video.platform_video_id,
+                        title=video.title,
+                        description=video.description,
+                        published_at=video.created_at,
+                        duration=video.duration,
+                        platform_url=video.platform_url,
+                        metrics=metrics_dict
+                    )
             
             stats[platform] = ChannelStats(
                 platform=platform,
-                total_videos=counted_videos,
-                total_views=total_views,
-                total_likes=total_likes,
-                total_shares=total_shares,
-                total_comments=total_comments,
-                avg_engagement_rate=avg_engagement,
+                total_videos=totals["total_videos"],
+                total_views=totals["total_views"],
+                total_likes=totals["total_likes"],
+                total_shares=totals["total_shares"],
+                total_comments=totals["total_comments"],
+                avg_engagement_rate=totals["avg_engagement_rate"],
                 most_popular_video=most_popular_video
             )
         
@@ -649,25 +945,22 @@ class OAuthChannelDiscovery:
     
     def get_total_views_across_platforms(self) -> Tuple[int, Dict[str, int]]:
         """Get total views across all platforms (YouTube Shorts only)"""
-        all_videos = self.db.list_videos(status="published")
+        return self._cached_metrics(("total_views", "published"), self._load_total_views)
+    
+    def _load_total_views(self) -> Tuple[int, Dict[str, int]]:
+        """Sum latest views per platform, streaming videos in batches"""
         total_views = 0
-        platform_views = {}
+        platform_views = defaultdict(int)
         
-        for video in all_videos:
-            # For YouTube, only count Shorts (60 seconds or less)
-            if video.platform == "youtube" and video.duration > 60:
-                continue
-                
-            metrics = self.db.get_latest_metrics(video.video_id, video.platform)
-            if metrics:
-                views = metrics.views
-                total_views += views
-                
-                if video.platform not in platform_views:
-                    platform_views[video.platform] = 0
-                platform_views[video.platform] += views
+        # YouTube only counts Shorts (60 seconds or less); filtered in SQL
+        for videos in self.db.iter_video_batches(status="published", countable_only=True):
+            # Load latest metrics for the whole batch in one query
+            latest = self.db.get_latest_metrics_bulk([(video.video_id, video.platform) for video in videos])
+            for (_, platform), metrics in latest.items():
+                total_views += metrics.views
+                platform_views[platform] += metrics.views
         
-        return total_views, platform_views
+        return total_views, dict(platform_views)
 
 async def main():
     """Example usage of OAuth channel discovery"""
@@ -2,9 +2,12 @@
 
 import requests
 import logging
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlencode
 
 from analytics.database import VideoRecord
 
@@ -16,6 +19,24 @@ class VideoTracker:
     def __init__(self, analytics_api_url: str = "http://localhost:8000"):
         self.analytics_api_url = analytics_api_url.rstrip('/')
         self.session = requests.Session()
+        
+        # Pool keep-alive connections and retry transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Last status successfully sent per video, to skip no-op PATCHes
+        self._status_cache: Dict[str, str] = {}
+        # Last ETag and decoded body per GET URL, for conditional requests
+        self._etags: Dict[str, Tuple[str, Any]] = {}
+    
+    def invalidate(self, video_id: str):
+        """Forget the cached status for a video changed outside this tracker"""
+        self._status_cache.pop(video_id, None)
     
     def track_video_creation(self, 
                            video_id: str,
@@ -64,6 +85,7 @@ class VideoTracker:
             
             response = self.session.patch(f"{self.analytics_api_url}/videos/{video_id}", json=updates)
             response.raise_for_status()
+            self._status_cache[video_id] = "uploaded"
             
             logger.info(f"Tracked video upload: {video_id} to {platform}")
             return True
@@ -74,6 +96,9 @@ class VideoTracker:
     
     def track_video_published(self, video_id: str) -> bool:
         """Track when a video is published"""
+        if self._status_cache.get(video_id) == "published":
+            return True
+        
         try:
             updates = {
                 "status": "published"
@@ -81,6 +106,7 @@ class VideoTracker:
             
             response = self.session.patch(f"{self.analytics_api_url}/videos/{video_id}", json=updates)
             response.raise_for_status()
+            self._status_cache[video_id] = "published"
             
             logger.info(f"Tracked video published: {video_id}")
             return True
@@ -91,6 +117,9 @@ class VideoTracker:
     
     def track_video_error(self, video_id: str, error_message: str = "") -> bool:
         """Track when a video processing fails"""
+        if self._status_cache.get(video_id) == "error":
+            return True
+        
         try:
             updates = {
                 "status": "error"
@@ -98,6 +127,7 @@ class VideoTracker:
             
             response = self.session.patch(f"{self.analytics_api_url}/videos/{video_id}", json=updates)
             response.raise_for_status()
+            self._status_cache[video_id] = "error"
             
             logger.info(f"Tracked video error: {video_id} - {error_message}")
             return True
@@ -106,12 +136,27 @@ class VideoTracker:
             logger.error(f"Failed to track video error {video_id}: {e}")
             return False
     
+    def _conditional_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a JSON resource, reusing the cached body when the server answers 304"""
+        cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        cached = self._etags.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        
+        response = self.session.get(url, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        
+        response.raise_for_status()
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etags[cache_key] = (etag, data)
+        return data
+    
     def get_video_status(self, video_id: str) -> Optional[Dict[str, Any]]:
         """Get the current status of a video"""
         try:
-            response = self.session.get(f"{self.analytics_api_url}/videos/{video_id}")
-            response.raise_for_status()
-            return response.json()
+            return self._conditional_get(f"{self.analytics_api_url}/videos/{video_id}")
             
         except Exception as e:
             logger.error(f"Failed to get video status {video_id}: {e}")
@@ -124,9 +169,7 @@ class VideoTracker:
             if platform:
                 params["platform"] = platform
             
-            response = self.session.get(f"{self.analytics_api_url}/analytics/summary", params=params)
-            response.raise_for_status()
-            return response.json()
+            return self._conditional_get(f"{self.analytics_api_url}/analytics/summary", params=params)
             
         except Exception as e:
             logger.error(f"Failed to get analytics summary: {e}")
@@ -1,21 +1,65 @@
 """OAuth callback server for handling authentication flows."""
 
-import socket
+import html
 import threading
 import urllib.parse
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import HTTPServer, ThreadingHTTPServer, BaseHTTPRequestHandler
+from string import Template
 from typing import Optional, Dict, Any
 import webbrowser
-import time
 from managers.ngrok_manager import NgrokManager
 
+# Response pages, encoded once at import
+_SUCCESS_HTML = b'''
+                <html>
+                <head><title>Authentication Successful</title></head>
+                <body>
+                    <h1>Authentication Successful!</h1>
+                    <p>You can close this window and return to the terminal.</p>
+                    <script>setTimeout(() => window.close(), 3000);</script>
+                </body>
+                </html>
+                '''
+
+_ERROR_HTML_TEMPLATE = Template('''
+                <html>
+                <head><title>Authentication Failed</title></head>
+                <body>
+                    <h1>Authentication Failed</h1>
+                    <p>Error: $error</p>
+                    <p>Description: $error_description</p>
+                    <p>Please check the terminal for more details.</p>
+                </body>
+                </html>
+                ''')
+
+_INVALID_HTML = b'''
+                <html>
+                <head><title>Invalid Callback</title></head>
+                <body>
+                    <h1>Invalid Callback</h1>
+                    <p>No authorization code or error found in callback.</p>
+                </body>
+                </html>
+                '''
+
 class OAuthCallbackHandler(BaseHTTPRequestHandler):
     """HTTP handler for OAuth callbacks."""
     
-    def __init__(self, *args, callback_data=None, **kwargs):
+    def __init__(self, *args, callback_data=None, callback_event=None, callback_lock=None, **kwargs):
         self.callback_data = callback_data
+        self.callback_event = callback_event
+        self.callback_lock = callback_lock
         super().__init__(*args, **kwargs)
     
+    def _send_html(self, status: int, payload: bytes):
+        """Send a complete HTML response with an explicit Content-Length."""
+        self.send_response(status)
+        self.send_header('Content-type', 'text/html')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
     def do_GET(self):
         """Handle GET requests (OAuth callbacks)."""
         if self.path.startswith('/callback'):
@@ -29,56 +73,22 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
                 state = query_params.get('state', [None])[0]
                 scopes = query_params.get('scopes', [None])[0]
                 
-                self.callback_data['code'] = code
-                self.callback_data['state'] = state
-                self.callback_data['scopes'] = scopes
-                self.callback_data['error'] = None
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(b'''
-                <html>
-                <head><title>Authentication Successful</title></head>
-                <body>
-                    <h1>Authentication Successful!</h1>
-                    <p>You can close this window and return to the terminal.</p>
-                    <script>setTimeout(() => window.close(), 3000);</script>
-                </body>
-                </html>
-                ''')
+                with self.callback_lock:
+                    self.callback_data.update(code=code, state=state, scopes=scopes, error=None)
+                self._send_html(200, _SUCCESS_HTML)
+                self.callback_event.set()
             elif 'error' in query_params:
                 error = query_params['error'][0]
                 error_description = query_params.get('error_description', ['Unknown error'])[0]
-                self.callback_data['error'] = error
-                self.callback_data['error_description'] = error_description
-                self.callback_data['code'] = None
-                self.send_response(400)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(f'''
-                <html>
-                <head><title>Authentication Failed</title></head>
-                <body>
-                    <h1>Authentication Failed</h1>
-                    <p>Error: {error}</p>
-                    <p>Description: {error_description}</p>
-                    <p>Please check the terminal for more details.</p>
-                </body>
-                </html>
-                '''.encode())
+                with self.callback_lock:
+                    self.callback_data.update(error=error, error_description=error_description, code=None)
+                self._send_html(400, _ERROR_HTML_TEMPLATE.safe_substitute(
+                    error=html.escape(error),
+                    error_description=html.escape(error_description)
+                ).encode())
+                self.callback_event.set()
             else:
-                self.send_response(400)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(b'''
-                <html>
-                <head><title>Invalid Callback</title></head>
-                <body>
-                    <h1>Invalid Callback</h1>
-                    <p>No authorization code or error found in callback.</p>
-                </body>
-                </html>
-                ''')
+                self._send_html(400, _INVALID_HTML)
         else:
             self.send_response(404)
             self.end_headers()
@@ -95,6 +105,9 @@ class OAuthCallbackServer:
         self.server = None
         self.thread = None
         self.callback_data = {}
+        self.callback_event = threading.Event()
+        # Guards callback_data, which handler threads write concurrently
+        self.callback_lock = threading.Lock()
         self.use_ngrok = use_ngrok
         self.ngrok_manager = None
         self.ngrok_domain = ngrok_domain
@@ -102,14 +115,14 @@ class OAuthCallbackServer:
     def start_server(self) -> bool:
         """Start the callback server."""
         try:
-            # Find an available port
-            self.port = self._find_available_port()
-            
             # Create server with custom handler
             def handler(*args, **kwargs):
-                return OAuthCallbackHandler(*args, callback_data=self.callback_data, **kwargs)
+                return OAuthCallbackHandler(*args, callback_data=self.callback_data,
+                                            callback_event=self.callback_event,
+                                            callback_lock=self.callback_lock, **kwargs)
             
-            self.server = HTTPServer(('localhost', self.port), handler)
+            self.server = self._bind_server(handler)
+            self.port = self.server.server_address[1]
             
             # Start server in a separate thread
             self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
@@ -146,16 +159,12 @@ class OAuthCallbackServer:
             if self.thread:
                 self.thread.join(timeout=1)
     
-    def _find_available_port(self) -> int:
-        """Find an available port starting from the preferred port."""
-        for port in range(self.port, self.port + 100):
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.bind(('localhost', port))
-                    return port
-            except OSError:
-                continue
-        raise RuntimeError("No available ports found")
+    def _bind_server(self, handler) -> HTTPServer:
+        """Bind on the preferred port, letting the OS pick a free one if it's taken."""
+        try:
+            return ThreadingHTTPServer(('localhost', self.port), handler)
+        except OSError:
+            return ThreadingHTTPServer(('localhost', 0), handler)
     
     def wait_for_callback(self, timeout: int = 300) -> Dict[str, Any]:
         """Wait for OAuth callback and return the result."""
@@ -165,11 +174,9 @@ class OAuthCallbackServer:
         print(f"Waiting for OAuth callback on http://localhost:{self.port}/callback...")
         print("If the browser doesn't open automatically, please visit the URL shown above.")
         
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if self.callback_data:
-                return self.callback_data
-            time.sleep(0.1)
+        if self.callback_event.wait(timeout):
+            with self.callback_lock:
+                return dict(self.callback_data)
         
         return {'error': 'timeout', 'error_description': 'Callback timeout'}
     
@@ -1,78 +1,207 @@
 """Command-line interface for content creation tools."""
 
 import argparse
+import json
+import os
+import stat
 import sys
+from functools import lru_cache
 from pathlib import Path
-from managers.oauth_manager import OAuthManager
-from managers.upload_manager import UploadManager
-from managers.config_manager import ConfigManager
+from time import time as _now
+from types import SimpleNamespace
+
+PLATFORMS = ("instagram", "youtube", "tiktok")
+PLATFORMS_WITH_ALL = PLATFORMS + ("all",)
+PLATFORM_SET = frozenset(PLATFORMS)
+
+# Managers are imported lazily by the factories below: OAuthManager and
+# UploadManager pull in the Google client and platform uploaders, so keeping
+# them off the module path keeps --help and config commands fast. Each
+# factory is cached so a CLI process shares one instance. The same goes for
+# concurrent.futures, which is only imported by the handlers that use it.
+
+@lru_cache(maxsize=1)
+def _oauth_manager():
+    """Get the process-wide OAuthManager, importing it on first use."""
+    from managers.oauth_manager import OAuthManager
+    return OAuthManager()
+
+@lru_cache(maxsize=1)
+def _upload_manager():
+    """Get the process-wide UploadManager, sharing the OAuthManager."""
+    from managers.upload_manager import UploadManager
+    return UploadManager(_oauth_manager())
+
+@lru_cache(maxsize=1)
+def _config_manager():
+    """Get the process-wide ConfigManager, importing it on first use."""
+    from managers.config_manager import ConfigManager
+    return ConfigManager()
+
+def _ensure_fresh(oauth_manager, platforms):
+    """Refresh tokens that are about to expire before dispatching uploads, concurrently."""
+    if not platforms:
+        return
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+        list(executor.map(oauth_manager.refresh_if_expiring, platforms))
+
+def _stat_video(video_path: Path):
+    """Stat a video once, returning None if it isn't an existing regular file."""
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+STATUS_CACHE_FILE = Path.home() / ".content_creation" / "status_cache.json"
+STATUS_CACHE_TTL_SECONDS = 60
+
+def _load_status_cache() -> dict:
+    """Load cached account statuses from check_auth, keyed by "platform:credentials mtime"."""
+    try:
+        with open(STATUS_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_status_cache(cache: dict):
+    """Persist cached account statuses, dropping entries past their TTL."""
+    cutoff = _now() - STATUS_CACHE_TTL_SECONDS
+    cache = {key: entry for key, entry in cache.items() if entry.get("cached_at", 0) > cutoff}
+    try:
+        STATUS_CACHE_FILE.parent.mkdir(exist_ok=True)
+        with open(STATUS_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"[WARNING] Could not save status cache: {e}")
+
+def _clear_status_cache():
+    """Forget cached account statuses, e.g. after re-authenticating."""
+    STATUS_CACHE_FILE.unlink(missing_ok=True)
+
+def _emit(lines):
+    """Write a block of output lines with a single write instead of one print per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 def setup_auth(args):
     """Set up authentication for social media platforms."""
-    oauth_manager = OAuthManager()
+    oauth_manager = _oauth_manager()
     
     if args.platform == "all":
         results = oauth_manager.authenticate_all()
+        if any(results.values()):
+            _clear_status_cache()
         print("\n=== Authentication Results ===")
         for platform, success in results.items():
             status = "[SUCCESS] Success" if success else "[ERROR] Failed"
             print(f"{platform.upper()}: {status}")
     else:
-        if args.platform == "instagram":
-            success = oauth_manager.authenticate_instagram()
-        elif args.platform == "youtube":
-            success = oauth_manager.authenticate_youtube()
-        elif args.platform == "tiktok":
-            success = oauth_manager.authenticate_tiktok()
-        else:
+        auth_method = oauth_manager.AUTH_METHODS.get(args.platform)
+        if auth_method is None:
             print(f"Unknown platform: {args.platform}")
             return
         
+        success = getattr(oauth_manager, auth_method[1])()
         if success:
+            _clear_status_cache()
             print(f"[SUCCESS] {args.platform.upper()} authentication successful!")
         else:
             print(f"[ERROR] {args.platform.upper()} authentication failed!")
 
+def reset_auth(args):
+    """Reset authentication and collected analytics data for a platform."""
+    from analytics.database import AnalyticsDatabase
+    platform = args.platform
+    
+    print(f"[RESET] Resetting {platform.upper()} authentication and data...")
+    auth_reset = _oauth_manager().reset_platform_auth(platform)
+    data_reset = AnalyticsDatabase().reset_platform_data(platform)
+    _clear_status_cache()
+    
+    if auth_reset and data_reset:
+        print(f"[SUCCESS] {platform.upper()} reset complete! Run 'content-cli auth {platform}' to re-authenticate.")
+    else:
+        print(f"[ERROR] {platform.upper()} reset incomplete")
+
 def check_auth(args):
     """Check authentication status for platforms."""
-    oauth_manager = OAuthManager()
-    upload_manager = UploadManager(oauth_manager)
+    oauth_manager = _oauth_manager()
+    upload_manager = _upload_manager()
     
-    platforms = ["instagram", "youtube", "tiktok"] if args.platform == "all" else [args.platform]
+    platforms = list(PLATFORMS) if args.platform == "all" else [args.platform]
     
-    print("=== Authentication Status ===")
-    for platform in platforms:
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Account lookups are cached briefly; any credential write changes the mtime and so the key
+    status_cache = _load_status_cache()
+    credentials_file = oauth_manager.credentials_file
+    try:
+        mtime_ns = credentials_file.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    
+    def fetch_status(platform):
+        # Token refresh and account lookups are network-bound, so platforms run concurrently
         creds = oauth_manager.get_credentials(platform)
+        if not (creds and creds.access_token):
+            return creds, None, False
+        cached = status_cache.get(f"{platform}:{mtime_ns}")
+        if cached and _now() - cached["cached_at"] < STATUS_CACHE_TTL_SECONDS:
+            return creds, cached["status"], False
+        return creds, upload_manager.get_upload_status(platform), True
+    
+    with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+        futures = {platform: executor.submit(fetch_status, platform) for platform in platforms}
+    
+    # Only successful lookups are cached, so errors are retried on the next check
+    for platform, future in futures.items():
+        if future.exception() is None:
+            creds, status, fetched = future.result()
+            if fetched and status.get("authenticated"):
+                status_cache[f"{platform}:{mtime_ns}"] = {"cached_at": _now(), "status": status}
+    _save_status_cache(status_cache)
+    
+    lines = ["=== Authentication Status ==="]
+    for platform in platforms:
+        # One platform failing shouldn't take down the whole report
+        try:
+            creds, status, _ = futures[platform].result()
+        except Exception as e:
+            lines.append(f"[ERROR] {platform.upper()}: Status check failed: {e}")
+            continue
+        
         if creds and creds.access_token:
-            print(f"[SUCCESS] {platform.upper()}: Authenticated")
+            lines.append(f"[SUCCESS] {platform.upper()}: Authenticated")
             
             # Show token expiration info
             if creds.expires_at:
-                import time
-                expires_in = creds.expires_at - int(time.time())
+                expires_in = creds.expires_at - int(_now())
                 if expires_in > 0:
                     hours = expires_in // 3600
                     minutes = (expires_in % 3600) // 60
-                    print(f"   Token expires in: {hours}h {minutes}m")
+                    lines.append(f"   Token expires in: {hours}h {minutes}m")
                 else:
-                    print(f"   Token expired: {abs(expires_in)}s ago")
+                    lines.append(f"   Token expired: {abs(expires_in)}s ago")
             else:
-                print(f"   Token expiration: Unknown")
+                lines.append(f"   Token expiration: Unknown")
             
-            # Get additional info
-            status = upload_manager.get_upload_status(platform)
+            # Show additional account info
             if status.get("authenticated"):
                 if "user_info" in status:
                     user_info = status["user_info"]
                     if "username" in user_info:
-                        print(f"   Username: {user_info['username']}")
+                        lines.append(f"   Username: {user_info['username']}")
                     elif "data" in user_info and "display_name" in user_info["data"]:
-                        print(f"   Display Name: {user_info['data']['display_name']}")
+                        lines.append(f"   Display Name: {user_info['data']['display_name']}")
                 elif "channels" in status and status["channels"]:
                     channel = status["channels"][0]
-                    print(f"   Channel: {channel['snippet']['title']}")
+                    lines.append(f"   Channel: {channel['snippet']['title']}")
         else:
-            print(f"[ERROR] {platform.upper()}: Not authenticated")
+            lines.append(f"[ERROR] {platform.upper()}: Not authenticated")
+    
+    _emit(lines)
 
 def test_upload(args):
     """Test upload functionality with a sample video."""
@@ -81,12 +210,12 @@ def test_upload(args):
         return
     
     video_path = Path(args.video)
-    if not video_path.exists():
+    if _stat_video(video_path) is None:
         print(f"Video file not found: {video_path}")
         return
     
-    oauth_manager = OAuthManager()
-    upload_manager = UploadManager(oauth_manager)
+    oauth_manager = _oauth_manager()
+    upload_manager = _upload_manager()
     
     # Sample metadata
     metadata = {
@@ -95,10 +224,12 @@ def test_upload(args):
         "hashtags": "#test #gaming #content"
     }
     
-    platforms = ["instagram", "youtube", "tiktok"] if args.platform == "all" else [args.platform]
+    platforms = list(PLATFORMS) if args.platform == "all" else [args.platform]
+    
+    _ensure_fresh(oauth_manager, platforms)
     
     print(f"Testing upload to {', '.join(platforms)}...")
-    results = upload_manager.upload_to_all_platforms(video_path, metadata, platforms)
+    results = upload_manager.upload_to_all_platforms(video_path, metadata, platforms, parallel=True)
     
     print("\n=== Upload Results ===")
     for platform, result in results.items():
@@ -109,26 +240,26 @@ def test_upload(args):
 
 def config_show(args):
     """Show current configuration."""
-    config_manager = ConfigManager()
+    config_manager = _config_manager()
     config_manager.show_config()
 
 def config_set_watch_dir(args):
     """Set the watch directory for video files."""
-    config_manager = ConfigManager()
+    config_manager = _config_manager()
     success = config_manager.set_watch_dir(args.path)
     if success:
         config_manager.validate_config()
 
 def config_set_processed_dir(args):
     """Set the processed directory for completed videos."""
-    config_manager = ConfigManager()
+    config_manager = _config_manager()
     success = config_manager.set_processed_dir(args.path)
     if success:
         config_manager.validate_config()
 
 def config_set_extensions(args):
     """Set video file extensions to watch for."""
-    config_manager = ConfigManager()
+    config_manager = _config_manager()
     extensions = args.extensions.split(',')
     success = config_manager.set_video_extensions(extensions)
     if success:
@@ -136,7 +267,7 @@ def config_set_extensions(args):
 
 def config_toggle_platform(args):
     """Enable or disable upload to a specific platform."""
-    config_manager = ConfigManager()
+    config_manager = _config_manager()
     enabled = args.action == "enable"
     success = config_manager.set_upload_platform(args.platform, enabled)
     if success:
@@ -144,43 +275,43 @@ def config_toggle_platform(args):
 
 def config_reset(args):
     """Reset configuration to defaults."""
-    config_manager = ConfigManager()
+    config_manager = _config_manager()
     config_manager.reset_to_defaults()
 
 def config_validate(args):
     """Validate current configuration."""
-    config_manager = ConfigManager()
+    config_manager = _config_manager()
     config_manager.validate_config()
 
 def retry_list(args):
     """List all failed uploads available for retry."""
-    oauth_manager = OAuthManager()
-    upload_manager = UploadManager(oauth_manager)
-    
-    failed_uploads = upload_manager.list_failed_uploads()
-    
-    if not failed_uploads:
-        print("[INFO] No failed uploads found")
-        return
-    
-    print("=== Failed Uploads ===")
-    for key, entry in failed_uploads.items():
-        video_name = entry["video_path"].split("\\")[-1]
-        platform = entry["platform"]
-        error = entry["error"]
-        timestamp = entry["timestamp"]
-        retry_count = entry["retry_count"]
+    # PureWindowsPath splits on both separators, so paths recorded on either OS work
+    from pathlib import PureWindowsPath
+    upload_manager = _upload_manager()
+    
+    found = False
+    for key, entry in upload_manager.iter_failed_uploads():
+        if not found:
+            print("=== Failed Uploads ===")
+            found = True
+        video_name = PureWindowsPath(entry["video_path"]).name
         
-        print(f"\n{platform.upper()}: {video_name}")
-        print(f"  Error: {error}")
-        print(f"  Failed: {timestamp}")
-        print(f"  Retry count: {retry_count}")
+        _emit([
+            f"\n{entry['platform'].upper()}: {video_name}",
+            f"  Error: {entry['error']}",
+            f"  Failed: {entry['timestamp']}",
+            f"  Retry count: {entry['retry_count']}",
+        ])
+    
+    if not found:
+        print("[INFO] No failed uploads found")
 
 def retry_single(args):
     """Retry a specific failed upload."""
-    oauth_manager = OAuthManager()
-    upload_manager = UploadManager(oauth_manager)
+    oauth_manager = _oauth_manager()
+    upload_manager = _upload_manager()
     
+    _ensure_fresh(oauth_manager, [args.platform])
     result = upload_manager.retry_failed_upload(args.video_name, args.platform)
     
     if result.success:
@@ -192,10 +323,18 @@ def retry_single(args):
 
 def retry_all(args):
     """Retry all failed uploads for specified platforms."""
-    oauth_manager = OAuthManager()
-    upload_manager = UploadManager(oauth_manager)
-    
-    platforms = args.platforms.split(",") if args.platforms else None
+    oauth_manager = _oauth_manager()
+    upload_manager = _upload_manager()
+    
+    # Normalize once so " YouTube, tiktok" works, then validate in one set difference
+    platforms = None
+    if args.platforms:
+        platforms = list(dict.fromkeys(p.strip().lower() for p in args.platforms.split(",") if p.strip()))
+        unknown = set(platforms) - PLATFORM_SET
+        if unknown:
+            print(f"[ERROR] Unknown platform(s): {', '.join(sorted(unknown))}")
+            return
+    _ensure_fresh(oauth_manager, platforms or list(PLATFORMS))
     results = upload_manager.retry_all_failed_uploads(platforms)
     
     print("\n=== Retry Results ===")
@@ -205,46 +344,45 @@ def retry_all(args):
 
 def retry_clear(args):
     """Clear failed uploads."""
-    oauth_manager = OAuthManager()
-    upload_manager = UploadManager(oauth_manager)
+    upload_manager = _upload_manager()
     
     upload_manager.clear_failed_uploads(args.platform)
     print(f"[CLEAR] Cleared failed uploads for {args.platform.upper() if args.platform else 'ALL'}")
 
 def upload_video(args):
     """Upload video with AI-generated captions to all platforms."""
-    from pathlib import Path
-    from managers.ai_manager import AIManager
-    from managers.config_manager import ConfigManager
-    
     video_path = Path(args.video)
-    if not video_path.exists():
+    video_stat = _stat_video(video_path)
+    if video_stat is None:
         print(f"[ERROR] Video file not found: {video_path}")
         return
     
     print(f"[UPLOAD] Processing video: {video_path.name}")
     
     # Initialize managers
-    oauth_manager = OAuthManager()
-    upload_manager = UploadManager(oauth_manager)
+    oauth_manager = _oauth_manager()
+    upload_manager = _upload_manager()
+    from managers.ai_manager import AIManager
     ai_manager = AIManager()
-    config_manager = ConfigManager()
+    config_manager = _config_manager()
     
     # Check authentication
     print("[AUTH] Checking authentication status...")
-    platforms = []
-    if oauth_manager.is_authenticated("instagram") and config_manager.get_config().upload_to_instagram:
-        platforms.append("instagram")
-    if oauth_manager.is_authenticated("youtube") and config_manager.get_config().upload_to_youtube:
-        platforms.append("youtube")
-    if oauth_manager.is_authenticated("tiktok") and config_manager.get_config().upload_to_tiktok:
-        platforms.append("tiktok")
+    config = config_manager.get_config()
+    enabled = {
+        "instagram": config.upload_to_instagram,
+        "youtube": config.upload_to_youtube,
+        "tiktok": config.upload_to_tiktok,
+    }
+    auth_status = oauth_manager.is_authenticated_bulk(p for p, on in enabled.items() if on)
+    platforms = [p for p, authenticated in auth_status.items() if authenticated]
     
     if not platforms:
         print("[ERROR] No authenticated platforms available for upload")
         return
     
     print(f"[AUTH] Uploading to: {', '.join(platforms)}")
+    _ensure_fresh(oauth_manager, platforms)
     
     # Generate AI metadata
     print("[AI] Generating captions and metadata...")
@@ -264,17 +402,18 @@ def upload_video(args):
     
     # Upload to platforms
     print(f"\n[UPLOAD] Starting upload to {len(platforms)} platforms...")
-    results = upload_manager.upload_to_all_platforms(video_path, metadata, platforms)
+    results = upload_manager.upload_to_all_platforms(video_path, metadata, platforms, parallel=True)
     
     # Print results
-    print(f"\n[RESULTS] Upload Summary:")
+    lines = ["\n[RESULTS] Upload Summary:"]
     for platform, result in results.items():
         if result.success:
-            print(f"  [SUCCESS] {platform.upper()}: {result.video_id}")
+            lines.append(f"  [SUCCESS] {platform.upper()}: {result.video_id}")
             if result.url:
-                print(f"    URL: {result.url}")
+                lines.append(f"    URL: {result.url}")
         else:
-            print(f"  [ERROR] {platform.upper()}: {result.error}")
+            lines.append(f"  [ERROR] {platform.upper()}: {result.error}")
+    _emit(lines)
     
     # Show retry info if there were failures
     failed_count = sum(1 for r in results.values() if not r.success)
@@ -282,119 +421,128 @@ def upload_video(args):
         print(f"\n[RETRY] {failed_count} uploads failed. Use 'uv run content-cli retry list' to see failed uploads.")
         print("[RETRY] Use 'uv run content-cli retry all' to retry failed uploads.")
 
-def main():
-    """Main CLI entry point."""
+# Declarative command tree: (name, help, [(argument flags, argument options)], handler)
+COMMANDS = [
+    ("auth", "Set up authentication", [
+        (("platform",), {"choices": PLATFORMS_WITH_ALL, "help": "Platform to authenticate with"}),
+    ], setup_auth),
+    ("check", "Check authentication status", [
+        (("platform",), {"choices": PLATFORMS_WITH_ALL, "help": "Platform to check"}),
+    ], check_auth),
+    ("reset", "Reset authentication and analytics data for a platform", [
+        (("platform",), {"choices": PLATFORMS, "help": "Platform to reset"}),
+    ], reset_auth),
+    ("test", "Test upload functionality", [
+        (("--video",), {"required": True, "help": "Path to video file"}),
+        (("--platform",), {"choices": PLATFORMS_WITH_ALL, "default": "all",
+                           "help": "Platform to test upload to"}),
+    ], test_upload),
+    ("upload", "Upload video with AI captions to all platforms", [
+        (("--video",), {"required": True, "help": "Path to video file"}),
+    ], upload_video),
+]
+
+# Command groups: (name, help, subcommand help, subcommands in the COMMANDS format)
+COMMAND_GROUPS = [
+    ("config", "Configuration management", "Configuration commands", [
+        ("show", "Show current configuration", [], config_show),
+        ("set-watch-dir", "Set watch directory for video files", [
+            (("path",), {"help": "Path to watch directory"}),
+        ], config_set_watch_dir),
+        ("set-processed-dir", "Set processed directory for completed videos", [
+            (("path",), {"help": "Path to processed directory"}),
+        ], config_set_processed_dir),
+        ("set-extensions", "Set video file extensions to watch for", [
+            (("extensions",), {"help": "Comma-separated list of extensions (e.g., mov,mp4,avi)"}),
+        ], config_set_extensions),
+        ("toggle-platform", "Enable or disable upload to a platform", [
+            (("platform",), {"choices": PLATFORMS, "help": "Platform to toggle"}),
+            (("action",), {"choices": ["enable", "disable"], "help": "Action to perform"}),
+        ], config_toggle_platform),
+        ("reset", "Reset configuration to defaults", [], config_reset),
+        ("validate", "Validate current configuration", [], config_validate),
+    ]),
+    ("retry", "Retry failed uploads", "Retry commands", [
+        ("list", "List all failed uploads", [], retry_list),
+        ("single", "Retry specific failed upload", [
+            (("video_name",), {"help": "Name of video file"}),
+            (("platform",), {"choices": PLATFORMS, "help": "Platform to retry"}),
+        ], retry_single),
+        ("all", "Retry all failed uploads", [
+            (("--platforms",), {"help": "Comma-separated platforms (default: all)"}),
+        ], retry_all),
+        ("clear", "Clear failed uploads", [
+            (("--platform",), {"choices": PLATFORMS, "help": "Platform to clear (default: all)"}),
+        ], retry_clear),
+    ]),
+]
+
+def _add_commands(subparsers, commands):
+    """Register commands from the declarative table on an argparse subparsers object."""
+    for name, help_text, arguments, handler in commands:
+        command_parser = subparsers.add_parser(name, help=help_text)
+        for flags, options in arguments:
+            command_parser.add_argument(*flags, **options)
+        command_parser.set_defaults(func=handler)
+
+COMMAND_NAMES = frozenset(
+    [name for name, *_ in COMMANDS] + [name for name, *_ in COMMAND_GROUPS]
+)
+
+def build_parser(command=None):
+    """Build the CLI argument parser, returning it with its command group parsers by name.
+    
+    When `command` is given only that command's subparsers are registered; the
+    full tree is built for top-level help, a missing command or an unknown one
+    (so argparse can list the valid choices).
+    """
     parser = argparse.ArgumentParser(description="Content Creation CLI")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    _add_commands(subparsers, [entry for entry in COMMANDS if command in (None, entry[0])])
     
-    # Setup auth command
-    auth_parser = subparsers.add_parser("auth", help="Set up authentication")
-    auth_parser.add_argument("platform", choices=["instagram", "youtube", "tiktok", "all"],
-                           help="Platform to authenticate with")
-    auth_parser.set_defaults(func=setup_auth)
-    
-    # Check auth command
-    check_parser = subparsers.add_parser("check", help="Check authentication status")
-    check_parser.add_argument("platform", choices=["instagram", "youtube", "tiktok", "all"],
-                            help="Platform to check")
-    check_parser.set_defaults(func=check_auth)
-    
-    # Test upload command
-    test_parser = subparsers.add_parser("test", help="Test upload functionality")
-    test_parser.add_argument("--video", required=True, help="Path to video file")
-    test_parser.add_argument("--platform", choices=["instagram", "youtube", "tiktok", "all"],
-                           default="all", help="Platform to test upload to")
-    test_parser.set_defaults(func=test_upload)
-    
-    # Upload command
-    upload_parser = subparsers.add_parser("upload", help="Upload video with AI captions to all platforms")
-    upload_parser.add_argument("--video", required=True, help="Path to video file")
-    upload_parser.set_defaults(func=upload_video)
-    
-    # Configuration commands
-    config_parser = subparsers.add_parser("config", help="Configuration management")
-    config_subparsers = config_parser.add_subparsers(dest="config_command", help="Configuration commands")
-    
-    # Show config
-    config_show_parser = config_subparsers.add_parser("show", help="Show current configuration")
-    config_show_parser.set_defaults(func=config_show)
-    
-    # Set watch directory
-    config_watch_parser = config_subparsers.add_parser("set-watch-dir", help="Set watch directory for video files")
-    config_watch_parser.add_argument("path", help="Path to watch directory")
-    config_watch_parser.set_defaults(func=config_set_watch_dir)
-    
-    # Set processed directory
-    config_processed_parser = config_subparsers.add_parser("set-processed-dir", help="Set processed directory for completed videos")
-    config_processed_parser.add_argument("path", help="Path to processed directory")
-    config_processed_parser.set_defaults(func=config_set_processed_dir)
-    
-    # Set video extensions
-    config_ext_parser = config_subparsers.add_parser("set-extensions", help="Set video file extensions to watch for")
-    config_ext_parser.add_argument("extensions", help="Comma-separated list of extensions (e.g., mov,mp4,avi)")
-    config_ext_parser.set_defaults(func=config_set_extensions)
-    
-    # Toggle platform
-    config_platform_parser = config_subparsers.add_parser("toggle-platform", help="Enable or disable upload to a platform")
-    config_platform_parser.add_argument("platform", choices=["instagram", "youtube", "tiktok"],
-                                       help="Platform to toggle")
-    config_platform_parser.add_argument("action", choices=["enable", "disable"],
-                                       help="Action to perform")
-    config_platform_parser.set_defaults(func=config_toggle_platform)
-    
-    # Reset config
-    config_reset_parser = config_subparsers.add_parser("reset", help="Reset configuration to defaults")
-    config_reset_parser.set_defaults(func=config_reset)
-    
-    # Validate config
-    config_validate_parser = config_subparsers.add_parser("validate", help="Validate current configuration")
-    config_validate_parser.set_defaults(func=config_validate)
-    
-    # Retry commands
-    retry_parser = subparsers.add_parser("retry", help="Retry failed uploads")
-    retry_subparsers = retry_parser.add_subparsers(dest="retry_command", help="Retry commands")
-    
-    # List failed uploads
-    retry_list_parser = retry_subparsers.add_parser("list", help="List all failed uploads")
-    retry_list_parser.set_defaults(func=retry_list)
-    
-    # Retry specific upload
-    retry_single_parser = retry_subparsers.add_parser("single", help="Retry specific failed upload")
-    retry_single_parser.add_argument("video_name", help="Name of video file")
-    retry_single_parser.add_argument("platform", choices=["instagram", "youtube", "tiktok"], 
-                                   help="Platform to retry")
-    retry_single_parser.set_defaults(func=retry_single)
-    
-    # Retry all failed uploads
-    retry_all_parser = retry_subparsers.add_parser("all", help="Retry all failed uploads")
-    retry_all_parser.add_argument("--platforms", help="Comma-separated platforms (default: all)")
-    retry_all_parser.set_defaults(func=retry_all)
-    
-    # Clear failed uploads
-    retry_clear_parser = retry_subparsers.add_parser("clear", help="Clear failed uploads")
-    retry_clear_parser.add_argument("--platform", choices=["instagram", "youtube", "tiktok"], 
-                                  help="Platform to clear (default: all)")
-    retry_clear_parser.set_defaults(func=retry_clear)
-    
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
-        return
-    
-    # Handle nested commands
-    if args.command == "config" and not hasattr(args, 'config_command'):
-        config_parser.print_help()
-        return
-    
-    if args.command == "retry" and not hasattr(args, 'retry_command'):
-        retry_parser.print_help()
-        return
+    group_parsers = {}
+    for name, help_text, sub_help, commands in COMMAND_GROUPS:
+        if command not in (None, name):
+            continue
+        group_parser = subparsers.add_parser(name, help=help_text)
+        _add_commands(group_parser.add_subparsers(dest=f"{name}_command", help=sub_help), commands)
+        group_parsers[name] = group_parser
     
-    # Handle retry command without subcommand - default to list
-    if args.command == "retry" and not hasattr(args, 'func'):
-        retry_list(args)
-        return
+    return parser, group_parsers
+
+def _fast_path_args(argv):
+    """Resolve the most common exact invocations without building the parser tree.
+    
+    Returns None for anything else (help, other flag orders, extra arguments) so
+    argparse handles validation and error messages as usual.
+    """
+    if argv == ["config", "show"]:
+        return SimpleNamespace(command="config", config_command="show", func=config_show)
+    if len(argv) == 3 and argv[:2] == ["upload", "--video"] and not argv[2].startswith("-"):
+        return SimpleNamespace(command="upload", video=argv[2], func=upload_video)
+    return None
+
+def main():
+    """Main CLI entry point."""
+    args = _fast_path_args(sys.argv[1:])
+    if args is None:
+        # Only register the invoked command's subparsers; anything else gets the full tree
+        command = sys.argv[1] if len(sys.argv) > 1 and sys.argv[1] in COMMAND_NAMES else None
+        parser, group_parsers = build_parser(command)
+        args = parser.parse_args()
+        
+        if not args.command:
+            parser.print_help()
+            return
+        
+        # Handle nested commands (argparse leaves the subcommand dest as None when omitted)
+        if args.command == "config" and getattr(args, 'config_command', None) is None:
+            group_parsers["config"].print_help()
+            return
+        
+        # Handle retry command without subcommand - default to list
+        if args.command == "retry" and getattr(args, 'retry_command', None) is None:
+            args.func = retry_list
     
     try:
         args.func(args)
@@ -4,9 +4,23 @@ import time
 import json
 from pathlib import Path
 from datetime import datetime
+import queue
+import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dotenv import load_dotenv
 
+# watchdog (the "watch" extra) delivers native filesystem events (inotify, FSEvents,
+# ReadDirectoryChangesW); without it the watcher falls back to polling the directory
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = None
+    Observer = None
+
 from managers.oauth_manager import OAuthManager
 from managers.upload_manager import UploadManager
 from managers.config_manager import ConfigManager
@@ -27,16 +41,36 @@ from .watcher_events import (
     emit_video_scheduled
 )
 
-# Load environment variables
-load_dotenv()
+# Managers are created on first use rather than at import: the API server imports
+# process_video_for_scheduling from here, and AIManager probes the backend API when
+# constructed. Each accessor is cached so the watcher shares one instance.
+
+@lru_cache(maxsize=1)
+def _config_manager():
+    return ConfigManager()
+
+@lru_cache(maxsize=1)
+def _oauth_manager():
+    return OAuthManager()
+
+@lru_cache(maxsize=1)
+def _upload_manager():
+    return UploadManager(_oauth_manager())
 
-# Initialize managers
-config_manager = ConfigManager()
-config = config_manager.get_config()
-oauth_manager = OAuthManager()
-upload_manager = UploadManager(oauth_manager)
-ai_manager = AIManager()
-video_processor = VideoProcessor()
+@lru_cache(maxsize=1)
+def _ai_manager():
+    return AIManager(_config_manager())
+
+@lru_cache(maxsize=1)
+def _video_processor():
+    return VideoProcessor()
+
+# Clips processed at once; each pipeline mostly waits on OpenAI, FFmpeg and uploads
+CLIP_WORKERS = max(1, int(os.getenv("CLIP_WORKERS", "2")))
+# AI captions only need the filename, so a burst's captions are generated ahead of its pipelines
+CAPTION_WORKERS = max(1, int(os.getenv("CAPTION_WORKERS", "5")))
+# Uploads run on their own pool so a slow upload never holds a slot FFmpeg could use
+UPLOAD_WORKERS = max(1, int(os.getenv("UPLOAD_WORKERS", "3")))
 
 def is_video_complete(path):
     """Return True when the file is stable (not growing)."""
@@ -49,9 +83,57 @@ def generate_ai_caption(filename):
     """Generate AI metadata using the new AI manager."""
     # Detect game context from filename
     game_context = "armagetron advanced | retroycycles"
-    return ai_manager.generate_metadata(filename, game_context)
+    return _ai_manager().generate_metadata(filename, game_context)
+
+@lru_cache(maxsize=None)
+def _processed_dir(path):
+    """Return the processed folder as a Path, creating it the first time it is used."""
+    processed_dir = Path(path)
+    processed_dir.mkdir(exist_ok=True)
+    return processed_dir
+
+def _branding_assets():
+    """Return (watermark_path, outro_path), each None when the asset is missing."""
+    assets_dir = Path("assets")
+    watermark_path = assets_dir / "syn_watermark.png"
+    outro_path = assets_dir / "outro.png"
+    return (watermark_path if watermark_path.exists() else None,
+            outro_path if outro_path.exists() else None)
+
+def _render_shorts(video_processor, path, processed_dir, audio_track, watermark_path, outro_path):
+    """Render the Shorts version of a clip with audio, fades, watermark and outro."""
+    return video_processor.process_for_shorts(
+        path,
+        processed_dir / f"{path.stem}_shorts{path.suffix}",
+        audio_track=audio_track,
+        fade_duration=1.0,  # 1 second fade in/out
+        watermark_path=watermark_path,
+        outro_path=outro_path,
+        outro_duration=3.0  # 3 second outro for visibility
+    )
+
+def _save_metadata(processed_dir, path, metadata):
+    """Write a clip's AI metadata next to it in the processed folder.
+    
+    The file is written under a temporary name and renamed into place, so a
+    crash mid-write never leaves a truncated JSON behind.
+    """
+    out_json = processed_dir / f"{path.stem}.json"
+    tmp_json = out_json.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_json, "w") as f:
+        json.dump(metadata, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_json, out_json)
+    return out_json
 
-def process_clip(path):
+def process_clip(path, write_complete=False, caption=None, publish=None):
+    """Run the full pipeline for one clip.
+    
+    write_complete skips the file-size stability wait; caption is an optional
+    future already generating the clip's AI metadata; publish replaces
+    publish_clip, e.g. to hand the upload to another pool.
+    """
     print(f"[+] Detected new clip: {path.name}")
     
     # Emit file detected event
@@ -61,20 +143,20 @@ def process_clip(path):
     except Exception as e:
         print(f"[WARNING] Could not emit file detected event: {e}")
     
-    if not is_video_complete(path):
+    if not write_complete and not is_video_complete(path):
         print("...waiting for file to finish writing")
         time.sleep(5)
 
     # Check if FFmpeg is available
-    if not video_processor.is_ffmpeg_available():
+    if not _video_processor().is_ffmpeg_available():
         print("[WARNING] FFmpeg not available. Videos will not be processed for Shorts.")
         print("   Install FFmpeg to enable video processing: https://ffmpeg.org/download.html")
-        process_video_without_ffmpeg(path)
+        process_video_without_ffmpeg(path, caption, publish)
         return
 
     # Check video requirements for YouTube Shorts
     try:
-        requirements = video_processor.check_video_requirements(path)
+        requirements = _video_processor().check_video_requirements(path)
         print(f"[ANALYSIS] Video analysis:")
         print(f"   Duration: {requirements['duration']:.1f}s (max: {requirements['max_duration']}s)")
         print(f"   Aspect ratio: {requirements['current_ratio']:.2f} (target: {requirements['target_ratio']:.2f})")
@@ -95,7 +177,7 @@ def process_clip(path):
         requirements = {'needs_processing': True}
 
     # Generate AI metadata
-    ai_meta = generate_ai_caption(path.name)
+    ai_meta = caption.result() if caption else generate_ai_caption(path.name)
     print(f"AI generated: {ai_meta.get('title')}")
     
     # Emit AI generation event
@@ -105,15 +187,12 @@ def process_clip(path):
         print(f"[WARNING] Could not emit AI generation event: {e}")
 
     # Get current config
-    current_config = config_manager.get_config()
-    processed_dir = Path(current_config.processed_dir)
-    processed_dir.mkdir(exist_ok=True)
+    current_config = _config_manager().get_config()
+    processed_dir = _processed_dir(current_config.processed_dir)
 
     # Check if we need to process for watermark/outro
-    assets_dir = Path("assets")
-    watermark_path = assets_dir / "syn_watermark.png"
-    outro_path = assets_dir / "outro.png"
-    has_assets = watermark_path.exists() or outro_path.exists()
+    watermark_path, outro_path = _branding_assets()
+    has_assets = watermark_path is not None or outro_path is not None
     
     # Process video for Shorts if needed OR if we have assets to apply
     processed_video_path = None
@@ -133,9 +212,9 @@ def process_clip(path):
                 print(f"[WARNING] Could not emit video processing event: {e}")
             
             # Look for audio track
-            audio_track = video_processor.find_audio_track(path)
+            audio_track = _video_processor().find_audio_track(path)
             if not audio_track:
-                audio_track = video_processor.get_default_audio_track()
+                audio_track = _video_processor().get_default_audio_track()
                 if audio_track:
                     print(f"[AUDIO] Using default audio track: {audio_track.name}")
             else:
@@ -148,14 +227,8 @@ def process_clip(path):
                 print(f"[WARNING] Could not emit audio match event: {e}")
             
             # Process with audio, fade effects, watermark, and outro
-            processed_video_path = video_processor.process_for_shorts(
-                path, 
-                processed_dir / f"{path.stem}_shorts{path.suffix}",
-                audio_track=audio_track,
-                fade_duration=1.0,  # 1 second fade in/out
-                watermark_path=watermark_path if watermark_path.exists() else None,
-                outro_path=outro_path if outro_path.exists() else None,
-                outro_duration=3.0  # 3 second outro for visibility
+            processed_video_path = _render_shorts(
+                _video_processor(), path, processed_dir, audio_track, watermark_path, outro_path
             )
             print(f"[SUCCESS] Video processed: {processed_video_path.name}")
             
@@ -177,13 +250,11 @@ def process_clip(path):
             processed_video_path = None
 
     # Save JSON metadata
-    out_json = processed_dir / f"{path.stem}.json"
-    with open(out_json, "w") as f:
-        json.dump(ai_meta, f, indent=2)
+    out_json = _save_metadata(processed_dir, path, ai_meta)
 
-    # Move original video to processed folder
+    # Move original video to processed folder (copied instead when it is on another drive)
     new_path = processed_dir / path.name
-    path.rename(new_path)
+    shutil.move(path, new_path)
     print(f"[SAVE] Saved metadata: {out_json}\n[MOVE] Moved clip: {new_path}")
     
     # Use processed video for uploads if available, otherwise use original
@@ -191,42 +262,36 @@ def process_clip(path):
     if processed_video_path:
         print(f"[UPLOAD] Using processed video for uploads: {upload_path.name}")
     
-    # Check if auto-scheduling is enabled
-    current_config = config_manager.get_config()
-    if current_config.auto_schedule:
-        # Schedule the video for later posting
-        schedule_for_posting(upload_path, ai_meta)
-    else:
-        # Upload immediately to social media platforms
-        upload_to_social_media(upload_path, ai_meta)
+    (publish or publish_clip)(upload_path, ai_meta)
 
-def process_video_without_ffmpeg(path):
+def process_video_without_ffmpeg(path, caption=None, publish=None):
     """Process video without FFmpeg (fallback)."""
-    ai_meta = generate_ai_caption(path.name)
+    ai_meta = caption.result() if caption else generate_ai_caption(path.name)
     print(f"AI generated: {ai_meta.get('title')}")
 
     # Get current config
-    current_config = config_manager.get_config()
-    processed_dir = Path(current_config.processed_dir)
-    processed_dir.mkdir(exist_ok=True)
+    current_config = _config_manager().get_config()
+    processed_dir = _processed_dir(current_config.processed_dir)
 
     # Save JSON metadata
-    out_json = processed_dir / f"{path.stem}.json"
-    with open(out_json, "w") as f:
-        json.dump(ai_meta, f, indent=2)
+    out_json = _save_metadata(processed_dir, path, ai_meta)
 
     # Move video to processed folder
     new_path = processed_dir / path.name
-    path.rename(new_path)
+    shutil.move(path, new_path)
     print(f"[SAVE] Saved metadata: {out_json}\n[MOVE] Moved clip: {new_path}")
     
-    # Check if auto-scheduling is enabled
+    (publish or publish_clip)(new_path, ai_meta)
+
+def publish_clip(video_path, metadata):
+    """Schedule or upload a processed clip, depending on auto_schedule."""
+    current_config = _config_manager().get_config()
     if current_config.auto_schedule:
         # Schedule the video for later posting
-        schedule_for_posting(new_path, ai_meta)
+        schedule_for_posting(video_path, metadata)
     else:
         # Upload immediately to social media platforms
-        upload_to_social_media(new_path, ai_meta)
+        upload_to_social_media(video_path, metadata)
 
 def schedule_for_posting(video_path, metadata):
     """Schedule video for posting to social media platforms."""
@@ -237,7 +302,7 @@ def schedule_for_posting(video_path, metadata):
     print(f"{'='*60}")
     
     # Get current config
-    current_config = config_manager.get_config()
+    current_config = _config_manager().get_config()
     
     # Get enabled platforms
     platforms = []
@@ -255,7 +320,7 @@ def schedule_for_posting(video_path, metadata):
     # Check authentication for each platform
     authenticated_platforms = []
     for platform in platforms:
-        if oauth_manager.is_authenticated(platform):
+        if _oauth_manager().is_authenticated(platform):
             authenticated_platforms.append(platform)
         else:
             print(f"[WARNING] {platform.upper()} not authenticated - skipping")
@@ -306,11 +371,11 @@ def process_video_for_scheduling(video_path: Path, ai_manager: AIManager = None,
     """
     # Use global instances if not provided
     if ai_manager is None:
-        ai_manager = globals()['ai_manager']
+        ai_manager = _ai_manager()
     if video_processor is None:
-        video_processor = globals()['video_processor']
+        video_processor = _video_processor()
     if config_manager is None:
-        config_manager = globals()['config_manager']
+        config_manager = _config_manager()
     
     print(f"\n{'='*60}")
     print(f"Processing: {video_path.name}")
@@ -324,14 +389,11 @@ def process_video_for_scheduling(video_path: Path, ai_manager: AIManager = None,
     
     # Get config
     current_config = config_manager.get_config()
-    processed_dir = Path(current_config.processed_dir)
-    processed_dir.mkdir(exist_ok=True)
+    processed_dir = _processed_dir(current_config.processed_dir)
     
     # Check if we need to process for watermark/outro
-    assets_dir = Path("assets")
-    watermark_path = assets_dir / "syn_watermark.png"
-    outro_path = assets_dir / "outro.png"
-    has_assets = watermark_path.exists() or outro_path.exists()
+    watermark_path, outro_path = _branding_assets()
+    has_assets = watermark_path is not None or outro_path is not None
     
     # Check video requirements
     print("[2/4] Analyzing video...")
@@ -358,14 +420,8 @@ def process_video_for_scheduling(video_path: Path, ai_manager: AIManager = None,
                 print(f"  [OK] Using audio: {audio_track.name}")
             
             # Process video
-            processed_video_path = video_processor.process_for_shorts(
-                video_path,
-                processed_dir / f"{video_path.stem}_shorts{video_path.suffix}",
-                audio_track=audio_track,
-                fade_duration=1.0,
-                watermark_path=watermark_path if watermark_path.exists() else None,
-                outro_path=outro_path if outro_path.exists() else None,
-                outro_duration=3.0
+            processed_video_path = _render_shorts(
+                video_processor, video_path, processed_dir, audio_track, watermark_path, outro_path
             )
             print(f"  [OK] Processed: {processed_video_path.name}")
         except Exception as e:
@@ -377,15 +433,13 @@ def process_video_for_scheduling(video_path: Path, ai_manager: AIManager = None,
     
     # Save JSON metadata
     print("[4/4] Saving metadata...")
-    out_json = processed_dir / f"{video_path.stem}.json"
-    with open(out_json, "w") as f:
-        json.dump(ai_meta, f, indent=2)
+    out_json = _save_metadata(processed_dir, video_path, ai_meta)
     print(f"  [OK] Metadata saved: {out_json.name}")
     
     # Move original to processed folder
     new_path = processed_dir / video_path.name
     if not new_path.exists():  # Don't move if already there
-        video_path.rename(new_path)
+        shutil.move(video_path, new_path)
         print(f"  [OK] Moved original to: {new_path}")
     
     # Use processed video if available, otherwise original
@@ -398,10 +452,10 @@ def upload_to_social_media(video_path, metadata):
     """Upload video to configured social media platforms (legacy - now uses scheduling)."""
     
     # Get current config
-    current_config = config_manager.get_config()
+    current_config = _config_manager().get_config()
     
     # Check which platforms to upload to
-    platforms = config_manager.get_upload_platforms()
+    platforms = _config_manager().get_upload_platforms()
     
     if not platforms:
         print("No platforms configured for upload")
@@ -409,11 +463,12 @@ def upload_to_social_media(video_path, metadata):
     
     print(f"\n[UPLOAD] Uploading to {', '.join(platforms)}...")
     
-    # Check authentication for each platform
-    for platform in platforms:
-        if not oauth_manager.is_authenticated(platform):
+    # Check authentication for each platform (build a new list; removing while iterating skipped entries)
+    auth_status = _oauth_manager().is_authenticated_bulk(platforms)
+    for platform, authenticated in auth_status.items():
+        if not authenticated:
             print(f"[WARNING] {platform.upper()} not authenticated. Run 'uv run python -c \"from content_creation.oauth_manager import OAuthManager; OAuthManager().authenticate_{platform}()\"' to authenticate.")
-            platforms.remove(platform)
+    platforms = [platform for platform, authenticated in auth_status.items() if authenticated]
     
     if not platforms:
         print("[ERROR] No authenticated platforms available for upload")
@@ -427,7 +482,7 @@ def upload_to_social_media(video_path, metadata):
         except Exception as e:
             print(f"[WARNING] Could not emit upload start event: {e}")
     
-    results = upload_manager.upload_to_all_platforms(video_path, metadata, platforms)
+    results = _upload_manager().upload_to_all_platforms(video_path, metadata, platforms, parallel=True)
     
     # Print summary and emit completion events
     print(f"\n[UPLOAD] Upload Summary:")
@@ -454,9 +509,65 @@ def upload_to_social_media(video_path, metadata):
             except Exception as e:
                 print(f"[WARNING] Could not emit error event: {e}")
 
+class ClipWorkers:
+    """Bounded pool running process_clip for several clips at once, at most once per path."""
+    
+    def __init__(self, max_workers: int = CLIP_WORKERS, caption_workers: int = CAPTION_WORKERS,
+                 upload_workers: int = UPLOAD_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="clip")
+        self._captions = ThreadPoolExecutor(max_workers=caption_workers, thread_name_prefix="caption")
+        self._uploads = ThreadPoolExecutor(max_workers=upload_workers, thread_name_prefix="upload")
+        self._in_flight = set()
+        self._lock = threading.Lock()
+    
+    def submit(self, path: Path, write_complete: bool = False):
+        with self._lock:
+            if path in self._in_flight:
+                return
+            self._in_flight.add(path)
+        # Start the caption now: clips queued behind busy workers then find it ready
+        caption = self._captions.submit(generate_ai_caption, path.name) if path.exists() else None
+        self._pool.submit(self._run, path, write_complete, caption)
+    
+    def _run(self, path: Path, write_complete: bool, caption):
+        try:
+            # Duplicate events can arrive after the clip was processed and moved away
+            if path.exists():
+                process_clip(path, write_complete, caption, self._publish)
+        except Exception as e:
+            # Worker exceptions would otherwise vanish with the future
+            print(f"[ERROR] Failed to process {path.name}: {e}")
+            try:
+                emit_error(path.name, str(e), "processing")
+            except Exception:
+                pass
+        finally:
+            with self._lock:
+                self._in_flight.discard(path)
+    
+    def _publish(self, video_path: Path, metadata):
+        # The clip has been moved out of the watch folder, so the next clip can start FFmpeg now
+        self._uploads.submit(self._run_publish, video_path, metadata)
+    
+    def _run_publish(self, video_path: Path, metadata):
+        try:
+            publish_clip(video_path, metadata)
+        except Exception as e:
+            print(f"[ERROR] Failed to publish {video_path.name}: {e}")
+            try:
+                emit_error(video_path.name, str(e), "upload")
+            except Exception:
+                pass
+    
+    def shutdown(self):
+        # Clip workers hand off uploads, so drain them before the upload pool
+        self._pool.shutdown(wait=True)
+        self._uploads.shutdown(wait=True)
+        self._captions.shutdown(wait=True)
+
 def watch_folder():
     # Get current config
-    current_config = config_manager.get_config()
+    current_config = _config_manager().get_config()
     watch_dir = Path(current_config.watch_dir)
     
     if not watch_dir.exists():
@@ -468,20 +579,81 @@ def watch_folder():
     event_emitter = get_event_emitter()
     event_emitter.set_status("watching")
     
-    # Use pathlib for better Windows compatibility
-    seen = set(f.name for f in watch_dir.iterdir() if f.is_file())
+    extensions = tuple(ext.lower() for ext in current_config.video_extensions)
     extensions_str = ", ".join(current_config.video_extensions)
     print(f"Watching {watch_dir} for new {extensions_str} files...")
     
-    while True:
-        current = set(f.name for f in watch_dir.iterdir() if f.is_file())
-        new_files = []
-        for f in current - seen:
-            if any(f.lower().endswith(ext) for ext in current_config.video_extensions):
-                new_files.append(f)
+    # Build the shared managers before the worker threads could race to create them
+    _upload_manager()
+    _ai_manager()
+    _video_processor()
+    # Handshake with OpenAI in the background so the first clip's caption doesn't pay for it
+    threading.Thread(target=_ai_manager().warm_up, name="openai-warmup", daemon=True).start()
+    
+    workers = ClipWorkers()
+    try:
+        if Observer is None:
+            print("[WATCH] watchdog not installed, polling for new clips (install the 'watch' extra for native events)")
+            _poll_folder(watch_dir, extensions, workers)
+        else:
+            _watch_folder_events(watch_dir, extensions, workers)
+    finally:
+        workers.shutdown()
+
+def _watch_folder_events(watch_dir, extensions, workers):
+    """Process new clips as the OS reports them, instead of rescanning the directory."""
+    clips = queue.Queue()
+    # inotify reports IN_CLOSE_WRITE, so on Linux a clip is queued once its writer has closed it
+    # and needs no stability polling; other backends queue on creation and poll the file size
+    closes_reported = Observer.__name__ == "InotifyObserver"
+    
+    class ClipHandler(FileSystemEventHandler):
+        def _enqueue(self, path, write_complete):
+            path = Path(path)
+            # Moves out to the processed directory also arrive here; only take clips landing in watch_dir
+            if path.parent == watch_dir and path.name.lower().endswith(extensions):
+                clips.put((path, write_complete))
         
-        for f in new_files:
-            process_clip(watch_dir / f)
+        def on_created(self, event):
+            if not event.is_directory and not closes_reported:
+                self._enqueue(event.src_path, write_complete=False)
+        
+        def on_closed(self, event):
+            if not event.is_directory:
+                self._enqueue(event.src_path, write_complete=True)
+        
+        def on_moved(self, event):
+            # Recorders often write to a temp name and rename into place once finished
+            if not event.is_directory:
+                self._enqueue(event.dest_path, write_complete=True)
+    
+    # Only the watch directory itself: recursive watches cost one inotify watch per subdirectory
+    observer = Observer()
+    observer.schedule(ClipHandler(), str(watch_dir), recursive=False)
+    observer.start()
+    
+    try:
+        while True:
+            workers.submit(*clips.get())
+    finally:
+        observer.stop()
+        observer.join()
+
+def _poll_folder(watch_dir, extensions, workers):
+    """Fallback when watchdog isn't installed: diff directory listings every few seconds."""
+    # scandir's entry types come from the directory listing itself, so is_file() needs no stat per file
+    with os.scandir(watch_dir) as entries:
+        seen = {entry.name for entry in entries if entry.is_file()}
+    
+    while True:
+        current = set()
+        with os.scandir(watch_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                current.add(entry.name)
+                if entry.name not in seen and entry.name.lower().endswith(extensions):
+                    workers.submit(watch_dir / entry.name)
         seen = current
         time.sleep(3)
 
@@ -491,10 +663,7 @@ def print_startup_config():
     print("AI CONTENT CREATION TOOL - STARTUP CONFIGURATION")
     print("=" * 60)
     
-    # Import config manager
-    from managers.config_manager import ConfigManager
-    config_manager = ConfigManager()
-    config = config_manager.get_config()
+    config = _config_manager().get_config()
     
     # Print basic configuration
     print(f"\n[CONFIG] Watch Directory: {config.watch_dir}")
@@ -517,7 +686,7 @@ def print_startup_config():
     ]
     
     for platform_name, enabled, platform_key in platforms:
-        auth_status = "[AUTHENTICATED]" if oauth_manager.is_authenticated(platform_key) else "[NOT AUTHENTICATED]"
+        auth_status = "[AUTHENTICATED]" if _oauth_manager().is_authenticated(platform_key) else "[NOT AUTHENTICATED]"
         enabled_status = "[ENABLED]" if enabled else "[DISABLED]"
         print(f"  {platform_name}: {enabled_status} {auth_status}")
     
@@ -541,15 +710,19 @@ def print_startup_config():
     
     # Count video files
     if watch_path.exists():
-        video_count = 0
-        for ext in config.video_extensions:
-            video_count += len(list(watch_path.glob(f"*{ext}")))
+        # One directory pass with a C-level suffix check, instead of one glob per extension
+        extensions = tuple(ext.lower() for ext in config.video_extensions)
+        with os.scandir(watch_path) as entries:
+            video_count = sum(1 for entry in entries if entry.name.lower().endswith(extensions))
         print(f"  Video files in watch directory: {video_count}")
     
     print("=" * 60)
 
 def main():
     """Main entry point for the clip watcher."""
+    # Load environment variables
+    load_dotenv()
+    config = _config_manager().get_config()
     
     # Auto-detect OBS replay buffer directory
     obs_detector = OBSDetector()
@@ -562,7 +735,7 @@ def main():
             print(f"\n[OBS] Replay buffer detected: {replay_buffer_path}")
             print(f"[OBS] Auto-configuring watch directory...")
             config.watch_dir = str(replay_buffer_path)
-            config_manager.save_config(config)
+            _config_manager().save_config(config)
             print(f"[OBS] Watch directory set to OBS replay buffer")
     
     # Print startup configuration
@@ -570,11 +743,11 @@ def main():
     
     # Check for authentication only for enabled platforms
     print(f"\n[AUTH] Checking authentication for enabled platforms...")
-    enabled_platforms = config_manager.get_upload_platforms()
+    enabled_platforms = _config_manager().get_upload_platforms()
     
     missing_auth = []
     for platform in enabled_platforms:
-        if not oauth_manager.is_authenticated(platform):
+        if not _oauth_manager().is_authenticated(platform):
             missing_auth.append(platform)
             print(f"[WARNING] {platform.upper()} is enabled but not authenticated.")
     
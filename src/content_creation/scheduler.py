@@ -134,7 +134,8 @@ class PostScheduler:
                 return
             
             # Check if post was missed (scheduled time is in the past)
-            scheduled_time = datetime.fromisoformat(post.scheduled_time) if isinstance(post.scheduled_time, str) else post.scheduled_time
+            # AnalyticsDatabase already parses scheduled_time into a datetime on read
+            scheduled_time = post.scheduled_time
             now = datetime.now()
             
             if scheduled_time < now:
@@ -12,6 +12,10 @@ class VideoProcessor:
     def __init__(self):
         """Initialize the video processor."""
         self.supported_formats = ['.mp4', '.mov', '.avi', '.mkv', '.webm']
+        # FFmpeg doesn't come and go while the process runs; probe it once
+        self._ffmpeg_available = None
+        # ffprobe results keyed by (path, mtime_ns, size), so a changed file is probed again
+        self._info_cache = {}
     
     def optimize_for_platform(self, input_path: Path, platform: str, output_path: Optional[Path] = None) -> Path:
         """
@@ -450,6 +454,23 @@ class VideoProcessor:
     
     def get_video_info(self, video_path: Path) -> dict:
         """Get detailed video information including audio details for Instagram compliance."""
+        try:
+            st = os.stat(video_path)
+            key = (str(video_path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        if key in self._info_cache:
+            return dict(self._info_cache[key])
+        
+        info = self._probe_video_info(video_path)
+        if key is not None:
+            if len(self._info_cache) >= 256:
+                self._info_cache.clear()
+            self._info_cache[key] = info
+        return dict(info)
+    
+    def _probe_video_info(self, video_path: Path) -> dict:
+        """Run ffprobe on a video and extract the fields get_video_info reports."""
         try:
             cmd = [
                 'ffprobe',
@@ -527,11 +548,13 @@ class VideoProcessor:
     
     def is_ffmpeg_available(self) -> bool:
         """Check if FFmpeg is available on the system."""
-        try:
-            subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        if self._ffmpeg_available is None:
+            try:
+                subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
+                self._ffmpeg_available = True
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                self._ffmpeg_available = False
+        return self._ffmpeg_available
     
     def check_video_requirements(self, video_path: Path) -> dict:
         """Check if video meets YouTube Shorts requirements."""
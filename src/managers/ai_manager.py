@@ -1,7 +1,11 @@
 """AI Manager for generating social media metadata using OpenAI."""
 
+import hashlib
 import json
 import os
+import threading
+import time
+from pathlib import Path
 from typing import Dict, Any, Optional
 from openai import OpenAI
 from dotenv import load_dotenv
@@ -10,6 +14,16 @@ from .config_manager import ConfigManager
 
 load_dotenv()
 
+# Generated metadata keyed by a hash of model, temperature, clip and prompt
+CAPTION_CACHE_DIR = Path.home() / ".content_creation" / "caption_cache"
+# Cached captions expire after this long, and the oldest are pruned past the file cap
+CAPTION_CACHE_MAX_AGE_SECONDS = 30 * 24 * 3600
+CAPTION_CACHE_MAX_FILES = 500
+
+# Caps OpenAI calls in flight across every AIManager, so a burst of clips can't set off 429s
+OPENAI_MAX_CONCURRENCY = max(1, int(os.getenv("OPENAI_MAX_CONCURRENCY", "5")))
+_openai_slots = threading.BoundedSemaphore(OPENAI_MAX_CONCURRENCY)
+
 class AIManager:
     """Manages AI-powered content generation for social media metadata."""
     
@@ -24,8 +38,10 @@ class AIManager:
         config = self.config_manager.get_config()
         
         # Initialize OpenAI client for local fallback
-        self.client = OpenAI()
+        # The SDK retries 429s after the server's retry-after delay; allow a few more than its default 2
+        self.client = OpenAI(max_retries=4)
         self.model = "gpt-4o-mini"  # Using gpt-4o-mini
+        self.temperature = 0.8
         
         # Initialize backend API client if configured
         self.api_client = None
@@ -111,53 +127,62 @@ class AIManager:
             else:
                 prompt = self._create_prompt(filename, game_context)
             
+            # Re-processing the same clip with the same prompt reuses the earlier result
+            cache_key = self._cache_key(prompt, filename, game_context, template.id if template else None)
+            cache_file = CAPTION_CACHE_DIR / f"{cache_key}.json"
+            cached = self._load_cached_metadata(cache_file)
+            if cached is not None:
+                print(f"[AI] Using cached metadata for {filename}")
+                return cached
+            
             # Generate metadata using OpenAI
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "video_metadata",
-                        "strict": True,
-                        "schema": {
-                            "type": "object",
-                            "properties": {
-                                "title": {
-                                    "type": "string",
-                                    "description": "The title of the video."
-                                },
-                                "caption": {
-                                    "type": "string",
-                                    "description": "A descriptive caption for the video."
-                                },
-                                "hashtags": {
-                                    "type": "array",
-                                    "description": "A list of hashtags associated with the video.",
-                                    "items": {
+            with _openai_slots:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": "video_metadata",
+                            "strict": True,
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "title": {
                                         "type": "string",
-                                        "description": "A single hashtag, including the # symbol.",
-                                        "pattern": "^#\\w+$"
+                                        "description": "The title of the video."
+                                    },
+                                    "caption": {
+                                        "type": "string",
+                                        "description": "A descriptive caption for the video."
+                                    },
+                                    "hashtags": {
+                                        "type": "array",
+                                        "description": "A list of hashtags associated with the video.",
+                                        "items": {
+                                            "type": "string",
+                                            "description": "A single hashtag, including the # symbol.",
+                                            "pattern": "^#\\w+$"
+                                        }
                                     }
-                                }
-                            },
-                            "required": [
-                                "title",
-                                "caption",
-                                "hashtags"
-                            ],
-                            "additionalProperties": False
+                                },
+                                "required": [
+                                    "title",
+                                    "caption",
+                                    "hashtags"
+                                ],
+                                "additionalProperties": False
+                            }
                         }
-                    }
-                },
-                temperature=0.8,
-                max_tokens=500
-            )
+                    },
+                    temperature=self.temperature,
+                    max_tokens=250  # Captions need ~150; caps a rambling reply
+                )
             
             # Parse the response
             content = response.choices[0].message.content
@@ -170,6 +195,8 @@ class AIManager:
             # Sanitize metadata to remove emojis and problematic characters
             metadata = self._sanitize_metadata(metadata)
             
+            self._save_cached_metadata(cache_file, metadata)
+            
             print(f"[AI] AI generated metadata for {filename}")
             print(f"   Title: {metadata.get('title', 'N/A')}")
             print(f"   Caption: {metadata.get('caption', 'N/A')[:50]}...")
@@ -184,6 +211,72 @@ class AIManager:
             print(f"[AI] AI generation failed: {e}")
             return self._get_fallback_metadata(filename)
     
+    def _cache_key(self, prompt: str, filename: str, game_context: str, template_id: Optional[int]) -> str:
+        """
+        Hash everything that determines the model's output for a clip.
+        
+        The filename is hashed separately from the prompt because templates
+        without a {filename} placeholder produce the same prompt for every clip.
+        """
+        parts = (self.model, self.temperature, template_id, filename, game_context, prompt)
+        return hashlib.sha256("\0".join(map(str, parts)).encode()).hexdigest()
+    
+    def _load_cached_metadata(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Load previously generated metadata, or None on a miss or an expired entry."""
+        try:
+            if time.time() - cache_file.stat().st_mtime > CAPTION_CACHE_MAX_AGE_SECONDS:
+                return None
+            with open(cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _prune_caption_cache(self):
+        """Delete expired cache entries, then the oldest ones beyond CAPTION_CACHE_MAX_FILES."""
+        now = time.time()
+        entries = []
+        try:
+            with os.scandir(CAPTION_CACHE_DIR) as it:
+                for entry in it:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    if now - mtime > CAPTION_CACHE_MAX_AGE_SECONDS:
+                        self._remove_cache_file(entry.path)
+                    else:
+                        entries.append((mtime, entry.path))
+        except OSError:
+            return
+        
+        excess = len(entries) - CAPTION_CACHE_MAX_FILES
+        if excess > 0:
+            entries.sort()
+            for _, path in entries[:excess]:
+                self._remove_cache_file(path)
+    
+    @staticmethod
+    def _remove_cache_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def _save_cached_metadata(self, cache_file: Path, metadata: Dict[str, Any]):
+        """Write generated metadata to the cache atomically, so readers never see a partial file."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(metadata, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"[AI] Could not cache metadata: {e}")
+            return
+        self._prune_caption_cache()
+    
     def _create_prompt(self, filename: str, game_context: str) -> str:
         """Create a prompt for AI metadata generation."""
         if "armagetron" in game_context.lower() or "tron" in game_context.lower():
@@ -231,6 +324,20 @@ Output JSON with keys: title, caption, hashtags."""
             "hashtags": "#gaming #shorts #epic #clutch"
         }
     
+    def warm_up(self) -> None:
+        """
+        Open the OpenAI connection ahead of the first caption.
+        
+        The client's connection pool is shared, so the first real request
+        skips the TCP/TLS handshake. Failures are ignored; it is only a hint.
+        """
+        if self.api_client:
+            return
+        try:
+            self.client.with_options(max_retries=0, timeout=10).models.retrieve(self.model)
+        except Exception:
+            pass
+    
     def generate_metadata_for_game(self, filename: str, game_name: str) -> Dict[str, Any]:
         """Generate metadata with specific game context."""
         return self.generate_metadata(filename, game_name)
@@ -4,7 +4,7 @@ import json
 import os
 import uuid
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 
 @dataclass
@@ -53,11 +53,26 @@ class Config:
 class ConfigManager:
     """Manages configuration settings for the content creation tool."""
     
+    # Parsed config files shared across instances, keyed by path -> (mtime_ns, data)
+    _file_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+    
     def __init__(self, config_file: Path = Path.home() / ".content_creation" / "config.json"):
         self.config_file = config_file
         self.config_file.parent.mkdir(exist_ok=True)
         self.config = self._load_config()
     
+    def _read_config_file(self) -> Dict[str, Any]:
+        """Read and parse the config file, reusing the parsed data while its mtime is unchanged."""
+        mtime_ns = self.config_file.stat().st_mtime_ns
+        cached = self._file_cache.get(self.config_file)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        with open(self.config_file, 'r') as f:
+            file_data = json.load(f)
+        self._file_cache[self.config_file] = (mtime_ns, file_data)
+        return file_data
+    
     def _load_config(self) -> Config:
         """Load configuration from file or create default, with env vars taking priority."""
         # Start with default config (which reads env vars)
@@ -66,8 +81,7 @@ class ConfigManager:
         # Load from file if it exists
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    file_data = json.load(f)
+                file_data = self._read_config_file()
                 
                 # Only override values that are NOT set via environment variables
                 if not os.getenv("UPLOAD_TO_INSTAGRAM"):
@@ -81,10 +95,10 @@ class ConfigManager:
                 if not os.getenv("PROCESSED_DIR"):
                     config.processed_dir = file_data.get("processed_dir", config.processed_dir)
                 if not os.getenv("VIDEO_EXTENSIONS"):
-                    config.video_extensions = file_data.get("video_extensions", config.video_extensions)
+                    config.video_extensions = list(file_data.get("video_extensions", config.video_extensions))
                 
-                # Load Discord webhooks
-                config.discord_webhooks = file_data.get("discord_webhooks", [])
+                # Load Discord webhooks (copied, since setters mutate them and the parsed data is shared)
+                config.discord_webhooks = [dict(webhook) for webhook in file_data.get("discord_webhooks", [])]
                 
                 # Load scheduling config (only if not set via env)
                 if not os.getenv("AUTO_SCHEDULE"):
@@ -2,6 +2,7 @@
 
 import os
 import json
+import threading
 import time
 import webbrowser
 from pathlib import Path
@@ -30,6 +31,13 @@ class OAuthCredentials:
 class OAuthManager:
     """Manages OAuth authentication for multiple social media platforms."""
     
+    # Platform -> (display name, authentication method name)
+    AUTH_METHODS = {
+        "instagram": ("Instagram", "authenticate_instagram"),
+        "youtube": ("YouTube", "authenticate_youtube"),
+        "tiktok": ("TikTok", "authenticate_tiktok"),
+    }
+    
     def __init__(self, credentials_dir: Path = Path.home() / ".content_creation"):
         self.credentials_dir = credentials_dir
         self.credentials_dir.mkdir(exist_ok=True)
@@ -37,6 +45,10 @@ class OAuthManager:
         
         # Load existing credentials
         self.credentials = self._load_credentials()
+        # Serializes credential file writes from concurrent refreshes
+        self._save_lock = threading.Lock()
+        # Access tokens whose refresh already failed in this process, by platform
+        self._failed_refresh_tokens: Dict[str, str] = {}
     
     def _load_credentials(self) -> Dict[str, OAuthCredentials]:
         """Load stored credentials from file."""
@@ -56,18 +68,19 @@ class OAuthManager:
     
     def _save_credentials(self):
         """Save credentials to file."""
-        data = {
-            platform: {
-                "access_token": creds.access_token,
-                "refresh_token": creds.refresh_token,
-                "expires_at": creds.expires_at,
-                "platform": creds.platform
+        with self._save_lock:
+            data = {
+                platform: {
+                    "access_token": creds.access_token,
+                    "refresh_token": creds.refresh_token,
+                    "expires_at": creds.expires_at,
+                    "platform": creds.platform
+                }
+                for platform, creds in self.credentials.items()
             }
-            for platform, creds in self.credentials.items()
-        }
-        
-        with open(self.credentials_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            
+            with open(self.credentials_file, 'w') as f:
+                json.dump(data, f, indent=2)
     
     def authenticate_instagram(self) -> bool:
         """Authenticate with Instagram Graph API for business accounts."""
@@ -485,24 +498,30 @@ class OAuthManager:
         
         # Check if token needs refresh/extension
         if creds.expires_at and creds.expires_at <= int(time.time()):
+            # Don't retry a refresh that already failed; re-authenticating issues a new token
+            if self._failed_refresh_tokens.get(platform) == creds.access_token:
+                return None
             print(f"[AUTH] {platform.upper()} token expired, attempting refresh...")
             if platform == "tiktok" and creds.refresh_token:
                 if self.refresh_tiktok_token(creds):
                     return creds
                 else:
                     print(f"[AUTH] {platform.upper()} token refresh failed, re-authentication required")
+                    self._failed_refresh_tokens[platform] = creds.access_token
                     return None
             elif platform == "instagram":
                 if self.extend_instagram_token(creds):
                     return creds
                 else:
                     print(f"[AUTH] {platform.upper()} token extension failed, re-authentication required")
+                    self._failed_refresh_tokens[platform] = creds.access_token
                     return None
             elif platform == "youtube" and creds.refresh_token:
                 if self.refresh_youtube_token(creds):
                     return creds
                 else:
                     print(f"[AUTH] {platform.upper()} token refresh failed, re-authentication required")
+                    self._failed_refresh_tokens[platform] = creds.access_token
                     return None
             else:
                 print(f"[AUTH] {platform.upper()} token expired and no refresh mechanism available")
@@ -510,11 +529,49 @@ class OAuthManager:
         
         return creds
     
+    def refresh_if_expiring(self, platform: str, skew_seconds: int = 300) -> bool:
+        """Refresh a platform's token ahead of time if it expires within skew_seconds."""
+        creds = self.credentials.get(platform)
+        if not creds:
+            return False
+        
+        # Unknown expiry or comfortably valid: nothing to do
+        if not creds.expires_at or creds.expires_at - int(time.time()) > skew_seconds:
+            return True
+        
+        print(f"[AUTH] {platform.upper()} token expires soon, refreshing ahead of upload...")
+        if platform == "tiktok" and creds.refresh_token:
+            return self.refresh_tiktok_token(creds)
+        elif platform == "instagram":
+            return self.extend_instagram_token(creds)
+        elif platform == "youtube" and creds.refresh_token:
+            return self.refresh_youtube_token(creds)
+        return False
+    
     def is_authenticated(self, platform: str) -> bool:
         """Check if we have valid credentials for a platform."""
         creds = self.get_credentials(platform)
         return creds is not None and creds.access_token is not None
     
+    def is_authenticated_bulk(self, platforms) -> Dict[str, bool]:
+        """Check authentication for several platforms in one pass over the credential store.
+        
+        Unexpired credentials are judged from a single snapshot of the store;
+        only expired ones go through get_credentials to attempt a refresh.
+        """
+        credentials = dict(self.credentials)
+        now = int(time.time())
+        results = {}
+        for platform in platforms:
+            creds = credentials.get(platform)
+            if creds is None:
+                results[platform] = False
+            elif creds.expires_at and creds.expires_at <= now:
+                results[platform] = self.is_authenticated(platform)
+            else:
+                results[platform] = creds.access_token is not None
+        return results
+    
     def reset_platform_auth(self, platform: str) -> bool:
         """Reset authentication for a specific platform."""
         if platform in self.credentials:
@@ -532,16 +589,10 @@ class OAuthManager:
         
         print("Starting authentication for all platforms...")
         
-        # Instagram
-        print("\n=== Instagram Authentication ===")
-        results["instagram"] = self.authenticate_instagram()
-        
-        # YouTube
-        print("\n=== YouTube Authentication ===")
-        results["youtube"] = self.authenticate_youtube()
-        
-        # TikTok
-        print("\n=== TikTok Authentication ===")
-        results["tiktok"] = self.authenticate_tiktok()
+        # Sequential on purpose: the Instagram and TikTok flows share one ngrok
+        # domain and each drives an interactive browser session
+        for platform, (display_name, method_name) in self.AUTH_METHODS.items():
+            print(f"\n=== {display_name} Authentication ===")
+            results[platform] = getattr(self, method_name)()
         
         return results
@@ -2,15 +2,34 @@
 
 import json
 import os
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .oauth_manager import OAuthManager
 from .discord_service import DiscordWebhookService
 from content_creation.types import FTPUploader, UploadResult
 from platform_uploaders import InstagramUploader, YouTubeUploader, TikTokUploader
 
+SUPPORTED_PLATFORMS = ("instagram", "youtube", "tiktok")
+
+# Errors raised before the platform accepted the request, so retrying can't publish twice.
+# Anything else (timeouts, 5xx) may have landed and is left for the next retry run.
+TRANSIENT_RETRY_ERRORS = (
+    "Connection refused",
+    "Failed to establish a new connection",
+    "Temporary failure in name resolution",
+    "429",
+    "Too Many Requests",
+)
+
+def is_transient_upload_error(error: Optional[str]) -> bool:
+    """Whether an upload error is safe to retry immediately."""
+    return bool(error) and any(marker in error for marker in TRANSIENT_RETRY_ERRORS)
+
 class UploadManager:
     """Manages video uploads to multiple social media platforms."""
     
@@ -29,6 +48,8 @@ class UploadManager:
         # Failed uploads tracking
         self.failed_uploads_file = Path.home() / ".content_creation" / "failed_uploads.json"
         self.failed_uploads_file.parent.mkdir(exist_ok=True)
+        # Serializes read-modify-write of the failed uploads file across retry workers
+        self._failed_lock = threading.Lock()
         
         # Initialize local analytics tracking (auto-detect)
         self.analytics_url: Optional[str] = None
@@ -170,11 +191,50 @@ class UploadManager:
         
         return validated
 
+    def _upload_single(self, platform: str, video_path: Path, validated_metadata: Dict[str, str],
+                       video_processor) -> UploadResult:
+        """Optimize, upload, track and report a video for one platform."""
+        print(f"\n--- Uploading to {platform.upper()} ---")
+        
+        # Optimize video for platform-specific requirements
+        try:
+            optimized_video = video_processor.optimize_for_platform(video_path, platform)
+            print(f"Using optimized video: {optimized_video.name}")
+        except Exception as e:
+            print(f"[WARNING] Optimization failed for {platform}: {e}")
+            print("Using original video...")
+            optimized_video = video_path
+        
+        if platform == "instagram":
+            result = self.upload_to_instagram(optimized_video, validated_metadata)
+        elif platform == "youtube":
+            result = self.upload_to_youtube(optimized_video, validated_metadata)
+        elif platform == "tiktok":
+            result = self.upload_to_tiktok(optimized_video, validated_metadata)
+        else:
+            result = UploadResult(platform, False, error="Unknown platform")
+        
+        # Track upload to analytics server (delivery notification)
+        self._track_upload_analytics(platform, video_path, validated_metadata, result)
+        
+        # Send Discord notifications for successful uploads
+        self._notify_discord(platform, video_path, validated_metadata, result)
+        
+        # Print result
+        if result.success:
+            print(f"[SUCCESS] {platform.upper()}: Success! Video ID: {result.video_id}")
+            if result.url:
+                print(f"   URL: {result.url}")
+        else:
+            print(f"[ERROR] {platform.upper()}: Failed - {result.error}")
+        
+        return result
+    
     def upload_to_all_platforms(self, video_path: Path, metadata: Dict[str, str], 
-                              platforms: List[str] = None) -> Dict[str, UploadResult]:
+                              platforms: List[str] = None, parallel: bool = False) -> Dict[str, UploadResult]:
         """Upload video to all specified platforms with platform-specific optimization."""
         if platforms is None:
-            platforms = ["instagram", "youtube", "tiktok"]
+            platforms = list(SUPPORTED_PLATFORMS)
         
         results = {}
         
@@ -187,41 +247,26 @@ class UploadManager:
         from content_creation.video_processor import VideoProcessor
         video_processor = VideoProcessor()
         
-        for platform in platforms:
-            print(f"\n--- Uploading to {platform.upper()} ---")
-            
-            # Optimize video for platform-specific requirements
-            try:
-                optimized_video = video_processor.optimize_for_platform(video_path, platform)
-                print(f"Using optimized video: {optimized_video.name}")
-            except Exception as e:
-                print(f"[WARNING] Optimization failed for {platform}: {e}")
-                print("Using original video...")
-                optimized_video = video_path
-            
-            if platform == "instagram":
-                results[platform] = self.upload_to_instagram(optimized_video, validated_metadata)
-            elif platform == "youtube":
-                results[platform] = self.upload_to_youtube(optimized_video, validated_metadata)
-            elif platform == "tiktok":
-                results[platform] = self.upload_to_tiktok(optimized_video, validated_metadata)
-            else:
-                results[platform] = UploadResult(platform, False, error="Unknown platform")
-            
-            # Track upload to analytics server (delivery notification)
-            result = results[platform]
-            self._track_upload_analytics(platform, video_path, validated_metadata, result)
-            
-            # Send Discord notifications for successful uploads
-            self._notify_discord(platform, video_path, validated_metadata, result)
+        if parallel and len(platforms) > 1:
+            # Each platform uploads on its own thread: total time is the slowest upload, not the sum
+            with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+                futures = {
+                    executor.submit(self._upload_single, platform, video_path, validated_metadata, video_processor): platform
+                    for platform in platforms
+                }
+                for future in as_completed(futures):
+                    platform = futures[future]
+                    try:
+                        results[platform] = future.result()
+                    except Exception as e:
+                        print(f"[ERROR] {platform.upper()}: Failed - {e}")
+                        results[platform] = UploadResult(platform, False, error=str(e))
             
-            # Print result
-            if result.success:
-                print(f"[SUCCESS] {platform.upper()}: Success! Video ID: {result.video_id}")
-                if result.url:
-                    print(f"   URL: {result.url}")
-            else:
-                print(f"[ERROR] {platform.upper()}: Failed - {result.error}")
+            # Keep results in the requested platform order
+            results = {platform: results[platform] for platform in platforms}
+        else:
+            for platform in platforms:
+                results[platform] = self._upload_single(platform, video_path, validated_metadata, video_processor)
         
         # Track failed uploads for retry
         self._track_failed_uploads(video_path, validated_metadata, results)
@@ -230,26 +275,27 @@ class UploadManager:
     
     def _track_failed_uploads(self, video_path: Path, metadata: Dict[str, str], results: Dict[str, UploadResult]):
         """Track failed uploads for later retry."""
-        failed_uploads = self._load_failed_uploads()
-        
-        for platform, result in results.items():
-            if not result.success:
-                failed_entry = {
-                    "video_path": str(video_path),
-                    "platform": platform,
-                    "metadata": metadata,
-                    "error": result.error,
-                    "timestamp": datetime.now().isoformat(),
-                    "retry_count": 0
-                }
-                
-                # Check if this video/platform combination already exists
-                existing_key = f"{video_path.name}_{platform}"
-                if existing_key not in failed_uploads:
-                    failed_uploads[existing_key] = failed_entry
-                    print(f"[RETRY] Added {platform.upper()} upload to retry queue")
-        
-        self._save_failed_uploads(failed_uploads)
+        with self._failed_lock:
+            failed_uploads = self._load_failed_uploads()
+            
+            for platform, result in results.items():
+                if not result.success:
+                    failed_entry = {
+                        "video_path": str(video_path),
+                        "platform": platform,
+                        "metadata": metadata,
+                        "error": result.error,
+                        "timestamp": datetime.now().isoformat(),
+                        "retry_count": 0
+                    }
+                    
+                    # Check if this video/platform combination already exists
+                    existing_key = f"{video_path.name}_{platform}"
+                    if existing_key not in failed_uploads:
+                        failed_uploads[existing_key] = failed_entry
+                        print(f"[RETRY] Added {platform.upper()} upload to retry queue")
+            
+            self._save_failed_uploads(failed_uploads)
     
     def _load_failed_uploads(self) -> Dict[str, Any]:
         """Load failed uploads from file."""
@@ -275,15 +321,21 @@ class UploadManager:
         """List all failed uploads available for retry."""
         return self._load_failed_uploads()
     
+    def iter_failed_uploads(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (key, entry) pairs for failed uploads available for retry."""
+        with self._failed_lock:
+            failed_uploads = self._load_failed_uploads()
+        yield from failed_uploads.items()
+    
     def retry_failed_upload(self, video_name: str, platform: str) -> UploadResult:
         """Retry a specific failed upload."""
-        failed_uploads = self._load_failed_uploads()
         key = f"{video_name}_{platform}"
+        with self._failed_lock:
+            failed_entry = self._load_failed_uploads().get(key)
         
-        if key not in failed_uploads:
+        if failed_entry is None:
             return UploadResult(platform, False, error="Failed upload not found")
         
-        failed_entry = failed_uploads[key]
         video_path = Path(failed_entry["video_path"])
         metadata = failed_entry["metadata"]
         
@@ -314,40 +366,83 @@ class UploadManager:
         else:
             return UploadResult(platform, False, error="Unknown platform")
         
-        # Update retry count
-        failed_entry["retry_count"] += 1
+        # Re-read under the lock so concurrent retries don't clobber each other's updates
+        with self._failed_lock:
+            failed_uploads = self._load_failed_uploads()
+            failed_entry = failed_uploads.get(key)
+            if failed_entry is not None:
+                # Update retry count
+                failed_entry["retry_count"] += 1
+                
+                if result.success:
+                    # Remove from failed uploads if successful
+                    del failed_uploads[key]
+                else:
+                    # Update error message
+                    failed_entry["error"] = result.error
+                    failed_entry["timestamp"] = datetime.now().isoformat()
+                
+                self._save_failed_uploads(failed_uploads)
         
         if result.success:
-            # Remove from failed uploads if successful
-            del failed_uploads[key]
             print(f"[SUCCESS] {platform.upper()} retry successful!")
         else:
-            # Update error message
-            failed_entry["error"] = result.error
-            failed_entry["timestamp"] = datetime.now().isoformat()
             print(f"[FAILED] {platform.upper()} retry failed: {result.error}")
         
-        self._save_failed_uploads(failed_uploads)
         return result
     
-    def retry_all_failed_uploads(self, platforms: List[str] = None) -> Dict[str, UploadResult]:
+    def _retry_with_backoff(self, video_name: str, platform: str, max_attempts: int = 3) -> UploadResult:
+        """
+        Retry a failed upload, backing off exponentially between attempts.
+        
+        Publishing isn't idempotent, so only errors from before the platform
+        accepted the request are retried here; anything else stays recorded in
+        the failed uploads file for the next retry run.
+        """
+        for attempt in range(max_attempts):
+            result = self.retry_failed_upload(video_name, platform)
+            if result.success or not is_transient_upload_error(result.error):
+                break
+            if attempt < max_attempts - 1:
+                time.sleep(2 ** attempt)
+        return result
+    
+    def retry_all_failed_uploads(self, platforms: List[str] = None, max_workers: int = 4) -> Dict[str, UploadResult]:
         """Retry all failed uploads for specified platforms."""
         if platforms is None:
-            platforms = ["instagram", "youtube", "tiktok"]
+            platforms = list(SUPPORTED_PLATFORMS)
         
-        failed_uploads = self._load_failed_uploads()
+        with self._failed_lock:
+            failed_uploads = self._load_failed_uploads()
         results = {}
         
         print(f"[RETRY] Retrying failed uploads for platforms: {', '.join(platforms)}")
         
-        for key, failed_entry in list(failed_uploads.items()):
-            platform = failed_entry["platform"]
-            if platform in platforms:
-                video_name = failed_entry["video_path"].split("\\")[-1]  # Get just filename
-                result = self.retry_failed_upload(video_name, platform)
-                results[f"{video_name}_{platform}"] = result
-        
-        return results
+        # Keys are "<video name>_<platform>", so the video name is recovered from the key itself
+        wanted = frozenset(platforms)
+        pending = [
+            (key, key[:-len(entry["platform"]) - 1], entry["platform"])
+            for key, entry in failed_uploads.items()
+            if entry["platform"] in wanted
+        ]
+        if not pending:
+            return results
+        
+        # Bounded pool: retries overlap, without flooding any one platform's API
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            futures = {
+                executor.submit(self._retry_with_backoff, video_name, platform): key
+                for key, video_name, platform in pending
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    results[key] = UploadResult(failed_uploads[key]["platform"], False, error=str(e))
+        
+        # Keep results in queue order
+        return {key: results[key] for key, _, _ in pending}
     
     def clear_failed_uploads(self, platform: str = None):
         """Clear failed uploads (optionally for specific platform)."""
@@ -17,6 +17,8 @@ class InstagramUploader:
     
     def __init__(self, ftp_uploader: FTPUploader):
         self.ftp_uploader = ftp_uploader
+        # Keep-alive session reused across Graph API calls and uploads
+        self.session = requests.Session()
     
     def upload(self, video_path: Path, metadata: Dict[str, str], creds: OAuthCredentials) -> UploadResult:
         """Upload video to Instagram Reels using FTP server and video_url parameter."""
@@ -24,7 +26,7 @@ class InstagramUploader:
             # Step 1: Get Instagram Business Account ID directly
             user_url = f"https://graph.instagram.com/v23.0/me?fields=id,name&access_token={creds.access_token}"
 
-            user_response = requests.get(user_url)
+            user_response = self.session.get(user_url)
             user_response.raise_for_status()
                 
             user_data = user_response.json()
@@ -46,7 +48,7 @@ class InstagramUploader:
             try:
                 print("[DEBUG] DEBUG: Testing video URL accessibility...")
                 print(f"[DEBUG] DEBUG: Testing URL: {video_url}")
-                test_response = requests.head(video_url, timeout=10, allow_redirects=True)
+                test_response = self.session.head(video_url, timeout=10, allow_redirects=True)
                 print(f"[DEBUG] DEBUG: Video URL test response: {test_response.status_code}")
                 if test_response.status_code != 200:
                     print(f"[WARNING]  Video URL might not be accessible: {test_response.status_code}")
@@ -116,7 +118,7 @@ class InstagramUploader:
             if 'caption' in media_data:
                 media_data['caption'] = media_data['caption'].encode('utf-8', errors='replace').decode('utf-8')
             
-            media_response = requests.post(media_url, data=media_data)
+            media_response = self.session.post(media_url, data=media_data)
             print(f"[DEBUG] DEBUG: Container response status: {media_response.status_code}")
             print(f"[DEBUG] DEBUG: Container response: {media_response.text}")
             
@@ -146,7 +148,7 @@ class InstagramUploader:
             for attempt in range(max_attempts):
                 print(f"[DEBUG] DEBUG: Status check attempt {attempt + 1}/{max_attempts}")
                 print(f"[DEBUG] DEBUG: Status URL: {status_url}")
-                status_response = requests.get(status_url)
+                status_response = self.session.get(status_url)
                 print(f"[DEBUG] DEBUG: Status response code: {status_response.status_code}")
                 print(f"[DEBUG] DEBUG: Status response: {status_response.text}")
                 status_response.raise_for_status()
@@ -192,7 +194,7 @@ class InstagramUploader:
             }
             
             print("Publishing Instagram Reel...")
-            publish_response = requests.post(publish_url, data=publish_data)
+            publish_response = self.session.post(publish_url, data=publish_data)
 
             publish_response.raise_for_status()
             
@@ -222,7 +224,7 @@ class InstagramUploader:
         try:
             # Get Instagram Business Account info and rate limits
             user_url = f"https://graph.instagram.com/v23.0/me?fields=id,name&access_token={creds.access_token}"
-            user_response = requests.get(user_url)
+            user_response = self.session.get(user_url)
             user_response.raise_for_status()
             
             user_data = user_response.json()
@@ -233,7 +235,7 @@ class InstagramUploader:
             
             # Get rate limit info
             rate_limit_url = f"https://graph.instagram.com/v23.0/{instagram_account_id}/content_publishing_limit?access_token={creds.access_token}"
-            rate_limit_response = requests.get(rate_limit_url)
+            rate_limit_response = self.session.get(rate_limit_url)
             
             rate_limit_info = {}
             if rate_limit_response.status_code == 200:
@@ -253,7 +255,7 @@ class InstagramUploader:
         try:
             # Get Instagram Business Account ID
             user_url = f"https://graph.instagram.com/v23.0/me?fields=id,name&access_token={creds.access_token}"
-            user_response = requests.get(user_url)
+            user_response = self.session.get(user_url)
             user_response.raise_for_status()
             
             user_data = user_response.json()
@@ -264,7 +266,7 @@ class InstagramUploader:
             
             # Get rate limit info
             rate_limit_url = f"https://graph.instagram.com/v23.0/{instagram_account_id}/content_publishing_limit?access_token={creds.access_token}"
-            rate_limit_response = requests.get(rate_limit_url)
+            rate_limit_response = self.session.get(rate_limit_url)
             rate_limit_response.raise_for_status()
             
             return rate_limit_response.json()
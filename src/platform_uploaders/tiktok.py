@@ -14,6 +14,10 @@ from content_creation.types import UploadResult
 class TikTokUploader:
     """Handles TikTok uploads using Content Posting API (Inbox Upload)."""
     
+    def __init__(self):
+        # Keep-alive session reused across Content Posting API calls and uploads
+        self.session = requests.Session()
+    
     def upload(self, video_path: Path, metadata: Dict[str, str], creds: OAuthCredentials) -> UploadResult:
         """Upload video to TikTok using Content Posting API (Inbox Upload)."""
         try:
@@ -45,7 +49,7 @@ class TikTokUploader:
             
             print(f"Initializing TikTok upload for {video_path.name} ({video_size} bytes)...")
             
-            init_response = requests.post(init_url, headers=headers, json=init_data)
+            init_response = self.session.post(init_url, headers=headers, json=init_data)
             
             # Better error handling for 400 errors
             if init_response.status_code == 400:
@@ -88,7 +92,7 @@ class TikTokUploader:
                 }
                 
                 print(f"Uploading video ({video_size} bytes)...")
-                upload_response = requests.put(upload_url, data=video_data, headers=upload_headers)
+                upload_response = self.session.put(upload_url, data=video_data, headers=upload_headers)
                 
                 # Better error handling for upload errors
                 if upload_response.status_code >= 400:
@@ -108,7 +112,7 @@ class TikTokUploader:
             # Wait for processing to complete
             max_attempts = 30  # 5 minutes max
             for attempt in range(max_attempts):
-                status_response = requests.post(status_url, headers=headers, json=status_data)
+                status_response = self.session.post(status_url, headers=headers, json=status_data)
                 status_response.raise_for_status()
                 
                 status_result = status_response.json()
@@ -148,7 +152,7 @@ class TikTokUploader:
             # Get user info
             user_info_url = "https://open-api.tiktok.com/user/info/"
             headers = {"Authorization": f"Bearer {creds.access_token}"}
-            response = requests.get(user_info_url, headers=headers)
+            response = self.session.get(user_info_url, headers=headers)
             response.raise_for_status()
             return {"authenticated": True, "user_info": response.json()}
             
@@ -1,12 +1,11 @@
 """Core scheduling logic for automated video posting."""
 
-import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
-from analytics.database import AnalyticsDatabase, ScheduledPost
+from analytics.database import AnalyticsDatabase, ScheduledPost, dump_metadata
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +61,7 @@ def schedule_video(video_path: str, metadata: Dict[str, Any], platforms: List[st
     # Create scheduled post record
     post = ScheduledPost(
         video_path=video_path,
-        metadata_json=json.dumps(metadata),
+        metadata_json=dump_metadata(metadata),
         platforms=",".join(platforms),
         scheduled_time=scheduled_time,
         status="pending",
@@ -0,0 +1,92 @@
+"""Tests for AIManager's on-disk caption cache."""
+
+import json
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+
+import analytics.database
+from analytics.database import AIPromptTemplate
+from managers import ai_manager
+from managers.ai_manager import AIManager
+
+
+class FakeCompletions:
+    """Stands in for client.chat.completions, counting API calls."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def create(self, **kwargs):
+        self.calls += 1
+        content = json.dumps({
+            "title": f"clip {self.calls}",
+            "caption": "caption",
+            "hashtags": ["#tron"],
+        })
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """An AIManager in local mode whose template has no {filename} placeholder."""
+    template = AIPromptTemplate(id=7, name="static", prompt_text="Write a hype caption.", is_active=True)
+    
+    class FakeDatabase:
+        def get_active_prompt_template(self):
+            return template
+        
+        def get_prompt_template(self, template_id):
+            return template if template_id == template.id else None
+    
+    monkeypatch.setattr(analytics.database, "AnalyticsDatabase", FakeDatabase)
+    monkeypatch.setattr(ai_manager, "CAPTION_CACHE_DIR", tmp_path / "captions")
+    
+    manager = AIManager.__new__(AIManager)
+    manager.model = "gpt-4o-mini"
+    manager.temperature = 0.8
+    manager.api_client = None
+    manager.completions = FakeCompletions()
+    manager.client = SimpleNamespace(chat=SimpleNamespace(completions=manager.completions))
+    return manager
+
+
+def test_same_template_different_clips_are_generated_separately(manager):
+    first = manager.generate_metadata("clip_one.mp4", "armagetron")
+    second = manager.generate_metadata("clip_two.mp4", "armagetron")
+    
+    assert manager.completions.calls == 2
+    assert first["title"] != second["title"]
+
+
+def test_same_clip_reuses_cached_caption(manager):
+    first = manager.generate_metadata("clip_one.mp4", "armagetron")
+    again = manager.generate_metadata("clip_one.mp4", "armagetron")
+    
+    assert manager.completions.calls == 1
+    assert again == first
+
+
+def test_expired_entries_are_regenerated(manager):
+    manager.generate_metadata("clip_one.mp4", "armagetron")
+    (cache_file,) = ai_manager.CAPTION_CACHE_DIR.glob("*.json")
+    stale = time.time() - ai_manager.CAPTION_CACHE_MAX_AGE_SECONDS - 60
+    os.utime(cache_file, (stale, stale))
+    
+    manager.generate_metadata("clip_one.mp4", "armagetron")
+    
+    assert manager.completions.calls == 2
+
+
+def test_cache_is_pruned_to_max_files(manager, monkeypatch):
+    monkeypatch.setattr(ai_manager, "CAPTION_CACHE_MAX_FILES", 2)
+    
+    for name in ("a.mp4", "b.mp4", "c.mp4"):
+        manager.generate_metadata(name, "armagetron")
+    
+    assert len(list(ai_manager.CAPTION_CACHE_DIR.glob("*.json"))) == 2
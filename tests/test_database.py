@@ -0,0 +1,181 @@
+"""Tests for AnalyticsDatabase's bulk, aggregate and ETag cache queries."""
+
+import pytest
+
+from analytics import database
+from analytics.database import AnalyticsDatabase, VideoMetrics, VideoRecord
+
+
+@pytest.fixture
+def db(tmp_path):
+    return AnalyticsDatabase(str(tmp_path / "analytics.db"))
+
+
+def make_video(video_id, platform="youtube", duration=30.0, status="published"):
+    return VideoRecord(
+        video_id=video_id,
+        title=f"Video {video_id}",
+        platform=platform,
+        duration=duration,
+        status=status
+    )
+
+
+def make_metrics(video_id, platform, views, collected_at, engagement_rate=0.0):
+    return VideoMetrics(
+        video_id=video_id,
+        platform=platform,
+        views=views,
+        likes=views // 10,
+        shares=views // 100,
+        comments=views // 50,
+        engagement_rate=engagement_rate,
+        collected_at=collected_at
+    )
+
+
+def test_add_videos_bulk_skips_duplicate_ids(db):
+    assert db.add_videos_bulk([make_video("a"), make_video("b")]) == 2
+
+    inserted = db.add_videos_bulk([
+        make_video("a", platform="tiktok"),
+        make_video("c"),
+        make_video("c", platform="instagram")
+    ])
+
+    assert inserted == 1
+    videos = {video.video_id: video for video in db.list_videos()}
+    assert sorted(videos) == ["a", "b", "c"]
+    # The first row for an id wins; later duplicates are ignored
+    assert videos["a"].platform == "youtube"
+    assert videos["c"].platform == "youtube"
+
+
+def test_add_videos_bulk_empty(db):
+    assert db.add_videos_bulk([]) == 0
+
+
+def test_get_latest_metrics_bulk_returns_newest_row_per_key(db):
+    db.add_videos_bulk([make_video("a"), make_video("b", platform="tiktok"), make_video("c")])
+    db.add_metrics_bulk([
+        make_metrics("a", "youtube", 10, "2026-01-01 00:00:00"),
+        make_metrics("a", "youtube", 30, "2026-01-03 00:00:00"),
+        make_metrics("a", "youtube", 20, "2026-01-02 00:00:00"),
+        make_metrics("b", "tiktok", 5, "2026-01-01 00:00:00"),
+        # Same timestamp: the later insert wins
+        make_metrics("b", "tiktok", 7, "2026-01-01 00:00:00"),
+        make_metrics("c", "youtube", 99, "2026-01-01 00:00:00")
+    ])
+
+    latest = db.get_latest_metrics_bulk([("a", "youtube"), ("b", "tiktok"), ("missing", "youtube")])
+
+    assert set(latest) == {("a", "youtube"), ("b", "tiktok")}
+    assert latest[("a", "youtube")].views == 30
+    assert latest[("b", "tiktok")].views == 7
+    assert db.get_latest_metrics_bulk([]) == {}
+
+
+def test_get_latest_metrics_bulk_spans_chunks(db):
+    keys = [(f"v{i}", "tiktok") for i in range(450)]
+    db.add_videos_bulk([make_video(video_id, platform="tiktok") for video_id, _ in keys])
+    db.add_metrics_bulk([
+        make_metrics(video_id, platform, i, "2026-01-01 00:00:00")
+        for i, (video_id, platform) in enumerate(keys)
+    ])
+
+    latest = db.get_latest_metrics_bulk(keys)
+
+    assert len(latest) == 450
+    assert latest[("v449", "tiktok")].views == 449
+
+
+def test_get_channel_aggregates_counts_latest_metrics_of_shorts(db):
+    db.add_videos_bulk([
+        make_video("short", duration=45),
+        make_video("long", duration=600),
+        make_video("tt", platform="tiktok", duration=600),
+        make_video("draft", platform="tiktok", status="created")
+    ])
+    db.add_metrics_bulk([
+        make_metrics("short", "youtube", 100, "2026-01-01 00:00:00", 0.1),
+        make_metrics("short", "youtube", 200, "2026-01-02 00:00:00", 0.3),
+        make_metrics("long", "youtube", 5000, "2026-01-02 00:00:00", 0.9),
+        make_metrics("tt", "tiktok", 50, "2026-01-02 00:00:00", 0.2),
+        make_metrics("draft", "tiktok", 1000, "2026-01-02 00:00:00", 0.5)
+    ])
+
+    aggregates = db.get_channel_aggregates(status="published")
+
+    assert aggregates["youtube"] == {
+        "total_videos": 1,
+        "total_views": 200,
+        "total_likes": 20,
+        "total_shares": 2,
+        "total_comments": 4,
+        "avg_engagement_rate": pytest.approx(0.3)
+    }
+    assert aggregates["tiktok"]["total_videos"] == 1
+    assert aggregates["tiktok"]["total_views"] == 50
+
+
+def test_get_channel_aggregates_keeps_platforms_without_countable_videos(db):
+    db.add_videos_bulk([
+        make_video("long", duration=600),
+        make_video("tt", platform="tiktok")
+    ])
+    db.add_metrics_bulk([make_metrics("long", "youtube", 5000, "2026-01-01 00:00:00", 0.9)])
+
+    aggregates = db.get_channel_aggregates(status="published")
+
+    assert aggregates["youtube"] == {
+        "total_videos": 0,
+        "total_views": 0,
+        "total_likes": 0,
+        "total_shares": 0,
+        "total_comments": 0,
+        "avg_engagement_rate": 0.0
+    }
+    # Countable videos without any metrics still count towards the total
+    assert aggregates["tiktok"]["total_videos"] == 1
+    assert aggregates["tiktok"]["total_views"] == 0
+
+
+def test_iter_video_batches_filters_and_batches(db):
+    db.add_videos_bulk(
+        [make_video(f"s{i}", duration=30) for i in range(5)]
+        + [make_video("long", duration=600), make_video("draft", status="created")]
+    )
+
+    batches = list(db.iter_video_batches(
+        platform="youtube", status="published", countable_only=True, batch_size=2
+    ))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert sorted(video.video_id for batch in batches for video in batch) == [f"s{i}" for i in range(5)]
+    assert list(db.iter_video_batches(platform="instagram")) == []
+
+
+def test_etag_round_trip(db):
+    assert db.get_etag("videos?id=a") is None
+
+    db.set_etag("videos?id=a", "tag-1", {"items": [1, 2]})
+    db.set_etag("videos?id=a", "tag-2", {"items": [3]})
+
+    assert db.get_etag("videos?id=a") == ("tag-2", {"items": [3]})
+
+
+def test_prune_etags_drops_only_stale_entries(db, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(database.time, "time", lambda: now[0])
+
+    db.set_etag("old", "tag", {})
+    db.set_etag("revalidated", "tag", {})
+    now[0] += 100
+    db.set_etag("new", "tag", {})
+    db.touch_etag("revalidated")
+    now[0] += 50
+
+    assert db.prune_etags(120) == 1
+    assert db.get_etag("old") is None
+    assert db.get_etag("revalidated") is not None
+    assert db.get_etag("new") is not None
@@ -0,0 +1,161 @@
+"""Tests for OAuthChannelDiscovery's HTTP retry and ETag cache handling."""
+
+import asyncio
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+pytest.importorskip("google.oauth2")
+pytest.importorskip("pyngrok")
+
+from analytics import oauth_channel_discovery
+from analytics.database import AnalyticsDatabase
+from analytics.oauth_channel_discovery import MAX_BACKOFF_SECONDS, OAuthChannelDiscovery
+
+
+class StubResponse:
+    def __init__(self, status, headers=None, body=None):
+        self.status = status
+        self.headers = headers or {}
+        self.body = body
+    
+    async def read(self):
+        return b""
+    
+    async def json(self):
+        return self.body
+    
+    async def text(self):
+        return json.dumps(self.body)
+
+
+class StubSession:
+    """Replays a script of responses and exceptions, one per request."""
+    
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = 0
+        self.sent_headers = []
+    
+    async def request(self, method, url, **kwargs):
+        self.requests += 1
+        self.sent_headers.append(kwargs.get("headers") or {})
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def discovery():
+    discovery = OAuthChannelDiscovery.__new__(OAuthChannelDiscovery)
+    discovery._semaphores = {"youtube": asyncio.Semaphore(4)}
+    discovery._limiters = {}
+    return discovery
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping."""
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(oauth_channel_discovery.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def request(discovery, session, max_retries=5):
+    return asyncio.run(discovery._request_with_retry("youtube", session, "GET", "https://example.test", max_retries=max_retries))
+
+
+def test_retry_after_is_capped(discovery, sleeps):
+    session = StubSession([StubResponse(429, {"Retry-After": "86400"}), StubResponse(200)])
+    
+    response = request(discovery, session)
+    
+    assert response.status == 200
+    assert sleeps == [MAX_BACKOFF_SECONDS]
+
+
+@pytest.mark.parametrize("retry_after", ["soon", "inf", "-5"])
+def test_unusable_retry_after_falls_back_to_backoff(discovery, sleeps, retry_after):
+    session = StubSession([StubResponse(503, {"Retry-After": retry_after}), StubResponse(200)])
+    
+    request(discovery, session)
+    
+    assert len(sleeps) == 1
+    assert 1 <= sleeps[0] < 2
+
+
+def test_connection_errors_and_timeouts_are_retried(discovery, sleeps):
+    session = StubSession([
+        aiohttp.ClientConnectionError("refused"),
+        asyncio.TimeoutError(),
+        StubResponse(200),
+    ])
+    
+    response = request(discovery, session)
+    
+    assert response.status == 200
+    assert session.requests == 3
+    assert len(sleeps) == 2
+
+
+def test_network_error_is_raised_once_retries_run_out(discovery, sleeps):
+    session = StubSession([aiohttp.ClientConnectionError("refused")] * 3)
+    
+    with pytest.raises(aiohttp.ClientConnectionError):
+        request(discovery, session, max_retries=2)
+    assert session.requests == 3
+
+
+def test_non_retryable_status_is_returned_immediately(discovery, sleeps):
+    session = StubSession([StubResponse(404)])
+    
+    assert request(discovery, session).status == 404
+    assert sleeps == []
+
+
+@pytest.fixture
+def etag_discovery(discovery, tmp_path):
+    discovery.db = AnalyticsDatabase(str(tmp_path / "analytics.db"))
+    discovery._etag_cache = {}
+    return discovery
+
+
+def youtube_get(discovery, session):
+    params = {"part": "contentDetails", "id": "abc"}
+    return asyncio.run(discovery._youtube_get(session, {"Authorization": "Bearer t"}, "videos", params))
+
+
+def test_youtube_get_stores_etag_on_200(etag_discovery, sleeps):
+    body = {"etag": "body-tag", "items": [{"id": "abc"}]}
+    session = StubSession([StubResponse(200, {"ETag": "header-tag"}, body)])
+    
+    assert youtube_get(etag_discovery, session) == body
+    
+    assert "If-None-Match" not in session.sent_headers[0]
+    [(cache_key, cached)] = etag_discovery._etag_cache.items()
+    assert cached == ("header-tag", body)
+    assert etag_discovery.db.get_etag(cache_key) == ("header-tag", body)
+
+
+def test_youtube_get_reuses_cached_body_on_304(etag_discovery, sleeps):
+    body = {"etag": "body-tag", "items": [{"id": "abc"}]}
+    youtube_get(etag_discovery, StubSession([StubResponse(200, {}, body)]))
+    
+    # A fresh in-memory tier forces the lookup through the database
+    etag_discovery._etag_cache = {}
+    session = StubSession([StubResponse(304)])
+    
+    assert youtube_get(etag_discovery, session) == body
+    assert session.sent_headers[0]["If-None-Match"] == "body-tag"
+
+
+def test_youtube_get_304_without_cache_entry_is_an_error(etag_discovery, sleeps):
+    session = StubSession([StubResponse(304)])
+    
+    assert youtube_get(etag_discovery, session) is None
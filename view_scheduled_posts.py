@@ -2,9 +2,12 @@
 """View currently scheduled posts."""
 
 import json
+import sys
 from datetime import datetime
 from src.analytics.database import AnalyticsDatabase
 
+TIME_FORMAT = '%Y-%m-%d %H:%M'
+
 def main():
     db = AnalyticsDatabase('analytics.db')
     posts = db.get_pending_posts()
@@ -23,6 +26,8 @@ def main():
         return
     
     now = datetime.now()
+    # Collect the whole listing and write it once rather than one print per line
+    lines = []
     
     for i, post in enumerate(posts, 1):
         try:
@@ -46,12 +51,16 @@ def main():
         else:
             countdown = f"in {hours}h {minutes}m"
         
-        print(f"{i}. {scheduled_time.strftime('%Y-%m-%d %H:%M')}")
-        print(f"   Title: {title[:60]}")
-        print(f"   Platforms: {post.platforms}")
-        print(f"   Status: {post.status.upper()} {countdown}")
-        print(f"   Video: {post.video_path}")
-        print()
+        lines.extend([
+            f"{i}. {scheduled_time.strftime(TIME_FORMAT)}",
+            f"   Title: {title[:60]}",
+            f"   Platforms: {post.platforms}",
+            f"   Status: {post.status.upper()} {countdown}",
+            f"   Video: {post.video_path}",
+            "",
+        ])
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print("=" * 80)
     print("NEXT STEPS:")